@@ -4,7 +4,7 @@ import unittest
 
 import pandas as pd
 
-from signalbot.backtest import backtest_signals
+from signalbot.backtest import backtest_signals, backtest_signals_batch
 
 
 class BacktestSignalsTests(unittest.TestCase):
@@ -32,6 +32,36 @@ class BacktestSignalsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             backtest_signals(df, initial_balance=0)
 
+    def test_batch_matches_single_variant_metrics(self) -> None:
+        df = pd.DataFrame(
+            {
+                "close": [100.0, 110.0, 115.0, 90.0, 88.0],
+                "signal": ["HOLD", "BUY", "SELL", "BUY", "SELL"],
+            },
+            index=pd.date_range("2023-01-01", periods=5, freq="h"),
+        )
+        variants = [
+            df["signal"],
+            pd.Series(["BUY", "HOLD", "HOLD", "HOLD", "SELL"], index=df.index),
+        ]
+
+        batch = backtest_signals_batch(df, variants, initial_balance=1000.0)
+
+        self.assertEqual(len(batch), 2)
+        for row, variant in enumerate(variants):
+            single, _, _ = backtest_signals(
+                df.assign(signal=variant), initial_balance=1000.0
+            )
+            self.assertEqual(batch.loc[row, "total_trades"], single["total_trades"])
+            self.assertAlmostEqual(batch.loc[row, "win_rate"], single["win_rate"])
+            self.assertAlmostEqual(batch.loc[row, "net_return"], single["net_return"])
+            self.assertAlmostEqual(batch.loc[row, "final_balance"], single["final_balance"])
+
+    def test_batch_requires_variants(self) -> None:
+        df = pd.DataFrame({"close": [100.0], "signal": ["HOLD"]})
+        with self.assertRaises(ValueError):
+            backtest_signals_batch(df, [])
+
     def test_empty_dataframe_returns_zero_metrics(self) -> None:
         df = pd.DataFrame(columns=["close", "signal"])
         metrics, trades, equity_curve = backtest_signals(df, initial_balance=500.0)
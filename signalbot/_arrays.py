@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True, slots=True)
+class OHLCVArrays:
+    """
+    Structure-of-arrays view over an OHLCV frame.
+
+    Built once at the DataFrame boundary so inner kernels operate on
+    contiguous float64 ndarrays instead of re-extracting columns. Columns
+    absent from the source frame are left as None.
+    """
+
+    open: np.ndarray | None
+    high: np.ndarray | None
+    low: np.ndarray | None
+    close: np.ndarray | None
+    volume: np.ndarray | None
+    index: pd.Index
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "OHLCVArrays":
+        columns = {}
+        for field in _OHLCV_FIELDS:
+            if field in df.columns:
+                arr = df[field].to_numpy(dtype=np.float64, copy=False)
+                columns[field] = np.ascontiguousarray(arr)
+            else:
+                columns[field] = None
+        return cls(index=df.index, **columns)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+try:  # Optional dependency – handled gracefully if missing
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised indirectly
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[misc]
+        """
+        No-op stand-in for numba.njit so decorated kernels degrade to
+        plain Python functions when numba is not installed.
+        """
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+
+        return wrapper
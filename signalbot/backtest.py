@@ -5,9 +5,96 @@ from typing import Dict, Iterable, Tuple
 import numpy as np
 import pandas as pd
 
+from ._arrays import OHLCVArrays
+from ._njit import njit, prange
 
 TradeLog = pd.DataFrame
 
+_EMPTY_METRICS: Dict[str, float] = {
+    "total_trades": 0,
+    "win_rate": 0.0,
+    "avg_gain": 0.0,
+    "avg_loss": 0.0,
+    "profit_factor": 0.0,
+    "net_return": 0.0,
+    "max_drawdown": 0.0,
+    "final_balance": 0.0,
+    "gross_gain": 0.0,
+    "gross_loss": 0.0,
+    "best_trade": 0.0,
+    "worst_trade": 0.0,
+    "win_loss_ratio": 0.0,
+    "initial_balance": 0.0,
+    "avg_hold_hours": 0.0,
+    "median_hold_hours": 0.0,
+    "exposure_pct": 0.0,
+}
+
+_EMPTY_TRADES_TEMPLATE = pd.DataFrame(
+    {
+        "entry_time": pd.Series(dtype="datetime64[ns]"),
+        "exit_time": pd.Series(dtype="datetime64[ns]"),
+        "entry_price": pd.Series(dtype="float64"),
+        "exit_price": pd.Series(dtype="float64"),
+        "pnl_pct": pd.Series(dtype="float64"),
+        "duration_hrs": pd.Series(dtype="float64"),
+    }
+)
+
+
+@njit(cache=True)
+def _scan_trades_kernel(is_buy: np.ndarray, is_sell: np.ndarray):  # pragma: no cover - thin numeric kernel
+    n = is_buy.shape[0]
+    max_trades = n // 2 + 1
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    n_entries = 0
+    n_exits = 0
+    in_position = False
+    for i in range(n):
+        if not in_position:
+            if is_buy[i]:
+                entry_idx[n_entries] = i
+                n_entries += 1
+                in_position = True
+        elif is_sell[i]:
+            exit_idx[n_exits] = i
+            n_exits += 1
+            in_position = False
+    return entry_idx[:n_entries], exit_idx[:n_exits], in_position
+
+
+def _scan_trades(is_buy: np.ndarray, is_sell: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Walk the buy/sell masks once, alternating between flat and long states.
+
+    Returns (entry_idx, exit_idx, open_at_end). When `open_at_end` is True the
+    final entry has no matching exit and must be force-liquidated on the last
+    bar by the caller. The scan itself is JIT-compiled when numba is
+    available and falls back to plain Python otherwise.
+    """
+    entry_idx, exit_idx, in_position = _scan_trades_kernel(
+        np.ascontiguousarray(is_buy), np.ascontiguousarray(is_sell)
+    )
+    return np.asarray(entry_idx, dtype=np.int64), np.asarray(exit_idx, dtype=np.int64), bool(in_position)
+
+
+def _signal_actions(signal: pd.Series, buy_set: set, sell_set: set) -> np.ndarray:
+    """
+    Classify signals through categorical codes so string upper-casing and
+    set membership run once per unique label instead of once per bar; the
+    per-bar work is a single int8 gather (0=hold, 1=buy, 2=sell).
+    """
+    categorical = pd.Categorical(signal.astype(str))
+    action_lookup = np.zeros(len(categorical.categories) + 1, dtype=np.int8)
+    for code, label in enumerate(categorical.categories):
+        normalized = str(label).upper()
+        if normalized in buy_set:
+            action_lookup[code] = 1
+        elif normalized in sell_set:
+            action_lookup[code] = 2
+    return action_lookup[np.asarray(categorical.codes)]
+
 
 def backtest_signals(
     df: pd.DataFrame,
@@ -26,164 +113,123 @@ def backtest_signals(
     if initial_balance <= 0:
         raise ValueError("initial_balance must be > 0")
 
-    empty_metrics = {
-        "total_trades": 0,
-        "win_rate": 0.0,
-        "avg_gain": 0.0,
-        "avg_loss": 0.0,
-        "profit_factor": 0.0,
-        "net_return": 0.0,
-        "max_drawdown": 0.0,
-        "final_balance": float(initial_balance),
-        "gross_gain": 0.0,
-        "gross_loss": 0.0,
-        "best_trade": 0.0,
-        "worst_trade": 0.0,
-        "win_loss_ratio": 0.0,
-        "initial_balance": float(initial_balance),
-        "avg_hold_hours": 0.0,
-        "median_hold_hours": 0.0,
-        "exposure_pct": 0.0,
-    }
-    empty_trades = pd.DataFrame(
-        columns=[
-            "entry_time",
-            "exit_time",
-            "entry_price",
-            "exit_price",
-            "pnl_pct",
-            "duration_hrs",
-        ]
-    )
-
     if df.empty:
+        empty_metrics = dict(
+            _EMPTY_METRICS,
+            final_balance=float(initial_balance),
+            initial_balance=float(initial_balance),
+        )
         empty_equity = pd.Series(dtype=float, name="equity")
-        return empty_metrics, empty_trades, empty_equity
+        return empty_metrics, _EMPTY_TRADES_TEMPLATE.copy(), empty_equity
 
     if not {"close", "signal"} <= set(df.columns):
         raise ValueError("DataFrame must include 'close' and 'signal' columns")
 
-    data = df.sort_index().copy()
-    closes = data["close"].astype(float)
-    signals = data["signal"].astype(str).str.upper()
+    # Column extraction below materializes fresh arrays, so no defensive
+    # copy is needed; sorting is skipped for already-monotonic indexes.
+    data = df if df.index.is_monotonic_increasing else df.sort_index()
+    arrays = OHLCVArrays.from_df(data)
+
+    # Validate prices once up front; the scan kernel then only ever sees
+    # numeric arrays, with no per-bar coercion or raise paths.
+    closes_arr = arrays.close
+    if (closes_arr <= 0).any():
+        raise ValueError("Close prices must be positive for backtesting")
 
     buy_set = {s.upper() for s in buy_signals}
     sell_set = {s.upper() for s in sell_signals}
 
-    cash = float(initial_balance)
-    position = 0.0
-    entry_price = None
-    entry_time = None
-
-    trade_log = []
-    pnl_decimals = []
-
-    equity_curve = []
-    equity_timestamps = []
-    peak_equity = cash
-    max_drawdown = 0.0
-
-    for timestamp, price, signal in zip(closes.index, closes.values, signals.values):
-        price = float(price)
-        if price <= 0:
-            raise ValueError("Close prices must be positive for backtesting")
-
-        if position == 0 and signal in buy_set:
-            commission_fee = cash * commission
-            cash_after_fee = cash - commission_fee
-            effective_price = price * (1 + slippage)
-            position = cash_after_fee / effective_price
-            cash = cash_after_fee - position * effective_price
-            entry_price = effective_price
-            entry_time = timestamp
-
-        elif position > 0 and signal in sell_set:
-            effective_price = price * (1 - slippage)
-            gross_proceeds = position * effective_price
-            commission_fee = gross_proceeds * commission
-            proceeds_net = gross_proceeds - commission_fee
-
-            pnl_decimal = (effective_price - entry_price) / entry_price
-            pnl_decimals.append(pnl_decimal)
-            trade_log.append(
-                {
-                    "entry_time": entry_time,
-                    "exit_time": timestamp,
-                    "entry_price": entry_price,
-                    "exit_price": effective_price,
-                    "pnl_pct": pnl_decimal * 100.0,
-                    "duration_hrs": (
-                        (timestamp - entry_time).total_seconds() / 3600.0
-                        if entry_time is not None
-                        else 0.0
-                    ),
-                }
-            )
-
-            cash += proceeds_net
-            position = 0.0
-            entry_price = None
-            entry_time = None
-
-        equity = cash + position * price
-        equity_curve.append(float(equity))
-        equity_timestamps.append(timestamp)
-        peak_equity = max(peak_equity, equity)
-        drawdown = (equity - peak_equity) / peak_equity if peak_equity else 0.0
-        max_drawdown = min(max_drawdown, drawdown)
-
-    if position > 0 and entry_price is not None:
-        final_timestamp = closes.index[-1]
-        price = float(closes.iloc[-1])
-        effective_price = price * (1 - slippage)
-        gross_proceeds = position * effective_price
-        commission_fee = gross_proceeds * commission
-        proceeds_net = gross_proceeds - commission_fee
-
-        pnl_decimal = (effective_price - entry_price) / entry_price
-        pnl_decimals.append(pnl_decimal)
-        trade_log.append(
-            {
-                "entry_time": entry_time,
-                "exit_time": final_timestamp,
-                "entry_price": entry_price,
-                "exit_price": effective_price,
-                "pnl_pct": pnl_decimal * 100.0,
-                "duration_hrs": (
-                    (final_timestamp - entry_time).total_seconds() / 3600.0
-                    if entry_time is not None
-                    else 0.0
-                ),
-            }
-        )
-
-        cash += proceeds_net
-        position = 0.0
-        entry_price = None
-        entry_time = None
-        if equity_curve:
-            equity_curve[-1] = float(cash)
-
-    final_equity = cash
-
-    total_trades = len(pnl_decimals)
-    wins = [p for p in pnl_decimals if p > 0]
-    losses = [p for p in pnl_decimals if p <= 0]
+    actions = _signal_actions(data["signal"], buy_set, sell_set)
+    is_buy = actions == 1
+    is_sell = actions == 2
+
+    entry_idx, exit_idx, open_at_end = _scan_trades(is_buy, is_sell)
+    n_bars = closes_arr.shape[0]
+    if open_at_end:
+        exit_idx = np.append(exit_idx, n_bars - 1)
+
+    # Vectorized trade economics: entry consumes all cash minus commission,
+    # exit returns proceeds minus commission, so each round trip multiplies
+    # the balance by (1 - commission)^2 * exit_px / entry_px.
+    entry_px = closes_arr[entry_idx] * (1 + slippage)
+    exit_px = closes_arr[exit_idx] * (1 - slippage)
+    pnl_arr = (exit_px - entry_px) / entry_px
+
+    trade_factors = (1 - commission) ** 2 * exit_px / entry_px
+    cash_before = initial_balance * np.concatenate(([1.0], np.cumprod(trade_factors)))
+    cash_after_exit = cash_before[1:]
+
+    # Piecewise equity reconstruction: a bar is either flat (equity equals
+    # the cash level after the most recent exit) or long (equity equals the
+    # position size carried from the most recent entry times the close).
+    n_trades = entry_idx.shape[0]
+    n_signal_exits = n_trades - 1 if open_at_end else n_trades
+    signal_exit_idx = exit_idx[:n_signal_exits]
+
+    position_delta = np.zeros(n_bars + 1, dtype=np.int64)
+    np.add.at(position_delta, entry_idx, 1)
+    np.add.at(position_delta, signal_exit_idx, -1)
+    in_position_arr = np.cumsum(position_delta[:n_bars]) > 0
+
+    entry_marker = np.zeros(n_bars, dtype=np.int64)
+    entry_marker[entry_idx] = 1
+    trade_id = np.cumsum(entry_marker) - 1
+
+    exit_marker = np.zeros(n_bars, dtype=np.int64)
+    exit_marker[signal_exit_idx] = 1
+    cash_levels = np.concatenate(([initial_balance], cash_after_exit[:n_signal_exits]))
+    cash_arr = cash_levels[np.cumsum(exit_marker)]
+
+    position_sizes = cash_before[:-1] * (1 - commission) / entry_px if n_trades else entry_px
+    coef_arr = position_sizes[np.maximum(trade_id, 0)] if n_trades else np.zeros(n_bars)
+
+    equity_arr = np.where(in_position_arr, coef_arr * closes_arr, cash_arr)
+
+    final_equity = float(cash_after_exit[-1]) if n_trades else float(initial_balance)
+
+    peak = np.maximum.accumulate(np.maximum(equity_arr, initial_balance))
+    max_drawdown = float(((equity_arr - peak) / peak).min()) if n_bars else 0.0
+
+    if open_at_end:
+        # Force-liquidation at the final close; the last bar reflects the
+        # post-sale cash balance rather than the marked position.
+        equity_arr[-1] = cash_after_exit[-1]
+
+    # Convert the index to an ndarray once and take entry/exit stamps by
+    # position; hold durations come from one datetime64 subtraction.
+    timestamps = data.index
+    ts_values = timestamps.to_numpy()
+    entry_times = ts_values[entry_idx]
+    exit_times = ts_values[exit_idx]
+    duration_hrs = (
+        (exit_times - entry_times) / np.timedelta64(1, "h")
+        if n_trades and ts_values.dtype.kind == "M"
+        else np.zeros(n_trades, dtype=np.float64)
+    )
 
-    win_rate = (len(wins) / total_trades * 100.0) if total_trades else 0.0
-    avg_gain = np.mean(wins) * 100.0 if wins else 0.0
-    avg_loss = np.mean(losses) * 100.0 if losses else 0.0
+    # Classify wins/losses in one pass and reuse the partial sums for every
+    # downstream statistic instead of re-scanning the pnl list per metric.
+    total_trades = int(pnl_arr.shape[0])
+    wins_mask = pnl_arr > 0
+    n_wins = int(wins_mask.sum())
+    n_losses = total_trades - n_wins
+    wins_sum = float(pnl_arr[wins_mask].sum())
+    losses_sum = float(pnl_arr[~wins_mask].sum())
+
+    win_rate = (n_wins / total_trades * 100.0) if total_trades else 0.0
+    avg_gain = wins_sum / n_wins * 100.0 if n_wins else 0.0
+    avg_loss = losses_sum / n_losses * 100.0 if n_losses else 0.0
     profit_factor = (
-        abs(np.sum(wins) / np.sum(losses)) if losses and np.sum(losses) != 0 else np.inf if wins else 0.0
+        abs(wins_sum / losses_sum) if n_losses and losses_sum != 0 else np.inf if n_wins else 0.0
     )
     net_return = (final_equity / initial_balance - 1.0) * 100.0
 
-    gross_gain_pct = sum(p for p in pnl_decimals if p > 0) * 100.0
-    gross_loss_pct = abs(sum(p for p in pnl_decimals if p < 0)) * 100.0
-    best_trade = max(pnl_decimals) * 100.0 if pnl_decimals else 0.0
-    worst_trade = min(pnl_decimals) * 100.0 if pnl_decimals else 0.0
+    gross_gain_pct = wins_sum * 100.0
+    gross_loss_pct = abs(losses_sum) * 100.0
+    best_trade = float(pnl_arr.max()) * 100.0 if total_trades else 0.0
+    worst_trade = float(pnl_arr.min()) * 100.0 if total_trades else 0.0
     win_loss_ratio = (
-        len(wins) / len(losses) if losses else float("inf") if wins else 0.0
+        n_wins / n_losses if n_losses else float("inf") if n_wins else 0.0
     )
 
     metrics = {
@@ -203,49 +249,160 @@ def backtest_signals(
         "initial_balance": float(initial_balance),
     }
 
-    trades_df = (
-        pd.DataFrame(trade_log, columns=empty_trades.columns)
-        if trade_log
-        else empty_trades.copy()
-    )
-
-    if not trades_df.empty:
-        avg_hold = trades_df["duration_hrs"].mean()
-        median_hold = trades_df["duration_hrs"].median()
+    # Trade table is assembled once from parallel typed arrays; no per-trade
+    # dict allocation or column-wise dtype inference happens along the way.
+    if total_trades:
+        trades_df = pd.DataFrame(
+            {
+                "entry_time": entry_times,
+                "exit_time": exit_times,
+                "entry_price": entry_px,
+                "exit_price": exit_px,
+                "pnl_pct": pnl_arr * 100.0,
+                "duration_hrs": duration_hrs,
+            }
+        )
     else:
-        avg_hold = 0.0
-        median_hold = 0.0
+        trades_df = _EMPTY_TRADES_TEMPLATE.copy()
 
     metrics.update(
         {
-            "avg_hold_hours": float(avg_hold),
-            "median_hold_hours": float(median_hold),
+            "avg_hold_hours": float(duration_hrs.mean()) if n_trades else 0.0,
+            "median_hold_hours": float(np.median(duration_hrs)) if n_trades else 0.0,
         }
     )
 
-    metrics = {
-        key: float(value) if isinstance(value, (np.floating, np.float64, np.float32)) else value
-        for key, value in metrics.items()
-    }
-
-    if equity_timestamps:
-        equity_index = pd.Index(
-            equity_timestamps,
-            name=data.index.name or "timestamp",
-        )
-        equity_series = pd.Series(equity_curve, index=equity_index, name="equity")
-    else:
-        equity_series = pd.Series(dtype=float, name="equity")
+    equity_index = pd.Index(timestamps, name=data.index.name or "timestamp")
+    equity_series = pd.Series(equity_arr, index=equity_index, name="equity")
 
     total_hours = 0.0
-    if equity_timestamps:
-        time_span = equity_timestamps[-1] - equity_timestamps[0]
+    if n_bars and isinstance(timestamps, pd.DatetimeIndex):
+        time_span = timestamps[-1] - timestamps[0]
         total_hours = time_span.total_seconds() / 3600.0 if time_span.total_seconds() > 0 else 0.0
     exposure_pct = (
-        trades_df["duration_hrs"].sum() / total_hours * 100.0
-        if not trades_df.empty and total_hours > 0
+        float(duration_hrs.sum()) / total_hours * 100.0
+        if n_trades and total_hours > 0
         else 0.0
     )
     metrics["exposure_pct"] = float(exposure_pct)
 
     return metrics, trades_df, equity_series
+
+
+@njit(cache=True, parallel=True)
+def _batch_backtest_kernel(  # pragma: no cover - thin numeric kernel
+    closes: np.ndarray,
+    actions_matrix: np.ndarray,
+    slippage: float,
+    commission: float,
+    initial_balance: float,
+):
+    n_variants, n_bars = actions_matrix.shape
+    total_trades = np.zeros(n_variants, dtype=np.int64)
+    win_rate = np.zeros(n_variants, dtype=np.float64)
+    net_return = np.zeros(n_variants, dtype=np.float64)
+    max_drawdown = np.zeros(n_variants, dtype=np.float64)
+    final_balance = np.empty(n_variants, dtype=np.float64)
+
+    for m in prange(n_variants):
+        cash = initial_balance
+        position = 0.0
+        entry_px = 0.0
+        peak = initial_balance
+        max_dd = 0.0
+        trades = 0
+        wins = 0
+
+        for i in range(n_bars):
+            action = actions_matrix[m, i]
+            if position == 0.0 and action == 1:
+                entry_px = closes[i] * (1 + slippage)
+                position = cash * (1 - commission) / entry_px
+                cash = 0.0
+            elif position > 0.0 and action == 2:
+                exit_px = closes[i] * (1 - slippage)
+                cash = position * exit_px * (1 - commission)
+                if (exit_px - entry_px) / entry_px > 0:
+                    wins += 1
+                trades += 1
+                position = 0.0
+
+            equity = cash + position * closes[i]
+            if equity > peak:
+                peak = equity
+            drawdown = (equity - peak) / peak
+            if drawdown < max_dd:
+                max_dd = drawdown
+
+        if position > 0.0:
+            exit_px = closes[n_bars - 1] * (1 - slippage)
+            cash = position * exit_px * (1 - commission)
+            if (exit_px - entry_px) / entry_px > 0:
+                wins += 1
+            trades += 1
+
+        total_trades[m] = trades
+        win_rate[m] = wins / trades * 100.0 if trades else 0.0
+        net_return[m] = (cash / initial_balance - 1.0) * 100.0
+        max_drawdown[m] = max_dd * 100.0
+        final_balance[m] = cash
+
+    return total_trades, win_rate, net_return, max_drawdown, final_balance
+
+
+def backtest_signals_batch(
+    df: pd.DataFrame,
+    signal_variants: Iterable[pd.Series],
+    *,
+    initial_balance: float = 10_000.0,
+    buy_signals: Iterable[str] = ("BUY", "STRONG BUY"),
+    sell_signals: Iterable[str] = ("SELL", "STRONG SELL"),
+    slippage: float = 0.0005,
+    commission: float = 0.0007,
+) -> pd.DataFrame:
+    """
+    Run many signal variants against the same price series in one pass.
+
+    Intended for parameter sweeps: the close array is shared across all
+    variants and the per-variant state machines run inside a single
+    parallel kernel, so M sweeps cost far less than M backtest_signals
+    calls. Returns summary metrics (one row per variant); use
+    backtest_signals for the full trade log and equity curve of a single
+    configuration.
+    """
+    if initial_balance <= 0:
+        raise ValueError("initial_balance must be > 0")
+
+    variants = list(signal_variants)
+    if not variants:
+        raise ValueError("signal_variants must contain at least one series")
+
+    data = df if df.index.is_monotonic_increasing else df.sort_index()
+    closes_arr = OHLCVArrays.from_df(data).close
+    if closes_arr is None:
+        raise ValueError("DataFrame must include a 'close' column")
+    if (closes_arr <= 0).any():
+        raise ValueError("Close prices must be positive for backtesting")
+
+    buy_set = {s.upper() for s in buy_signals}
+    sell_set = {s.upper() for s in sell_signals}
+
+    n_bars = closes_arr.shape[0]
+    actions_matrix = np.empty((len(variants), n_bars), dtype=np.int8)
+    for row, variant in enumerate(variants):
+        aligned = variant.reindex(data.index) if not variant.index.equals(data.index) else variant
+        actions_matrix[row] = _signal_actions(aligned, buy_set, sell_set)
+
+    total_trades, win_rate, net_return, max_drawdown, final_balance = _batch_backtest_kernel(
+        closes_arr, actions_matrix, slippage, commission, float(initial_balance)
+    )
+
+    return pd.DataFrame(
+        {
+            "total_trades": total_trades,
+            "win_rate": win_rate,
+            "net_return": net_return,
+            "max_drawdown": max_drawdown,
+            "final_balance": final_balance,
+        }
+    )
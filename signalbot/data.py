@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import logging
 import math
@@ -168,7 +169,20 @@ def _build_ohlcv_frame(market_data: dict[str, Any], interval: str) -> pd.DataFra
 
     combined = pd.DataFrame(index=prices_df.index)
     combined["price"] = prices_df["price"]
-    combined["volume"] = volume_df.reindex(prices_df.index, method="ffill")["volume"]
+
+    # Forward-fill volumes onto the price timestamps via a binary search on
+    # the sorted volume index rather than a full reindex alignment pass.
+    # An empty total_volumes list passes the key check above, so guard the
+    # gather: with no volume samples every row is simply NaN.
+    if len(volume_df):
+        vol_values = volume_df["volume"].to_numpy()
+        vol_times = volume_df.index.to_numpy()
+        positions = np.searchsorted(vol_times, prices_df.index.to_numpy(), side="right") - 1
+        combined["volume"] = np.where(
+            positions >= 0, vol_values[np.maximum(positions, 0)], np.nan
+        )
+    else:
+        combined["volume"] = np.nan
 
     resample_map = {
         "1m": "1min",
@@ -204,9 +218,15 @@ def _build_ohlcv_frame(market_data: dict[str, Any], interval: str) -> pd.DataFra
     return df
 
 
-def _generate_synthetic_ohlc(interval: str, lookback_days: int, seed: int = 42) -> pd.DataFrame:
+@lru_cache(maxsize=8)
+def _synthetic_arrays(
+    interval: str, lookback_days: int, seed: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, int, str]:
     """
-    Build a pseudo-random OHLCV dataframe when live data is unavailable.
+    Cached price/volume arrays for the synthetic dataset.
+
+    Deterministic in (interval, lookback_days, seed); the datetime index is
+    rebuilt per call by the wrapper since it is anchored to "now".
     """
     freq_map = {
         "1m": "1min",
@@ -246,28 +266,50 @@ def _generate_synthetic_ohlc(interval: str, lookback_days: int, seed: int = 42)
     step_minutes = max(step.total_seconds() / 60.0, 1.0)
     periods = max(int(math.ceil(total_minutes / step_minutes)), 60)
 
-    end = pd.Timestamp.utcnow().floor("min")
-    freq = freq_map[norm_interval]
-    index = pd.date_range(end=end, periods=periods, freq=freq)
-
     rng = np.random.default_rng(seed)
     base_price = 30_000.0
-    drift = rng.normal(0.0001, 0.0005, size=periods)
-    volatility = rng.normal(0, 0.008, size=periods)
-    log_returns = drift + volatility
-    close = base_price * np.exp(np.cumsum(log_returns))
 
-    open_ = close.copy()
+    # Drift and volatility are independent normals, so a single draw with
+    # the combined variance produces the same distribution as summing two
+    # separate arrays; subsequent steps reuse buffers in place to keep the
+    # transient allocation count low on large period counts.
+    log_returns = rng.normal(0.0001, math.hypot(0.0005, 0.008), size=periods)
+    close = np.cumsum(log_returns, out=log_returns)
+    np.exp(close, out=close)
+    close *= base_price
+
+    open_ = np.empty_like(close)
     open_[1:] = close[:-1]
     open_[0] = close[0] * (1 + rng.normal(0, 0.002))
 
-    body = np.abs(close - open_)
-    wick = np.maximum(body, base_price * rng.random(periods) * 0.01)
-    high = np.maximum(open_, close) + wick
-    low = np.maximum(0.01, np.minimum(open_, close) - wick)
+    body = np.subtract(close, open_)
+    np.abs(body, out=body)
+    wick = rng.random(periods)
+    wick *= base_price * 0.01
+    np.maximum(wick, body, out=wick)
+
+    high = np.maximum(open_, close)
+    high += wick
+    low = np.minimum(open_, close)
+    low -= wick
+    np.maximum(low, 0.01, out=low)
 
     volume = rng.lognormal(mean=12, sigma=0.35, size=periods)
 
+    return open_, high, low, close, volume, periods, freq_map[norm_interval]
+
+
+def _generate_synthetic_ohlc(interval: str, lookback_days: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a pseudo-random OHLCV dataframe when live data is unavailable.
+    """
+    open_, high, low, close, volume, periods, freq = _synthetic_arrays(
+        interval, lookback_days, seed
+    )
+
+    end = pd.Timestamp.utcnow().floor("min")
+    index = pd.date_range(end=end, periods=periods, freq=freq)
+
     df = pd.DataFrame(
         {
             "open": open_,
@@ -3,38 +3,126 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ._arrays import OHLCVArrays
+from ._njit import njit
+
 
 # ────────────────────────────────────────────────
 # Core Technical Indicators
 # ────────────────────────────────────────────────
+@njit(cache=True)
+def _ewma_kernel(x: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:  # pragma: no cover - thin numeric kernel
+    n = x.shape[0]
+    out = np.full(n, np.nan, dtype=x.dtype)
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if start == n:
+        return out
+    y = x[start]
+    count = 1
+    if count >= min_periods:
+        out[start] = y
+    for i in range(start + 1, n):
+        y = (1 - alpha) * y + alpha * x[i]
+        count += 1
+        if count >= min_periods:
+            out[i] = y
+    return out
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """
+    Series values as a float ndarray, keeping float32 input at float32
+    (halves the bytes moved by the memory-bound indicator passes) and
+    promoting everything else to float64.
+    """
+    arr = series.to_numpy(copy=False)
+    if arr.dtype == np.float32:
+        return arr
+    return arr.astype(np.float64, copy=False)
+
+
+def _ewma_values(arr: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """
+    Recursive EWMA matching `ewm(adjust=False).mean()`, computed by a
+    compiled loop. Interior NaNs change pandas' weighting, so those rare
+    arrays fall back to the pandas implementation. The input dtype is
+    preserved so float32 pipelines stay float32.
+    """
+    nan_mask = np.isnan(arr)
+    first_valid = int(nan_mask.argmin()) if not nan_mask.all() else arr.shape[0]
+    if nan_mask[first_valid:].any():
+        return (
+            pd.Series(arr)
+            .ewm(alpha=alpha, min_periods=min_periods, adjust=False)
+            .mean()
+            .to_numpy()
+        )
+    return _ewma_kernel(arr, alpha, min_periods)
+
+
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     """
     Wilder's RSI using exponential weighting (a.k.a. RMA).
     """
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
+    arr = _float_values(series)
+    delta = np.full_like(arr, np.nan)
+    if arr.shape[0] > 1:
+        np.subtract(arr[1:], arr[:-1], out=delta[1:])
 
-    avg_gain = gain.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
 
-    rs = avg_gain / avg_loss.replace(0, 1e-10)
-    return 100 - (100 / (1 + rs))
+    avg_gain = _ewma_values(gain, alpha=1 / period, min_periods=period)
+    avg_loss = _ewma_values(loss, alpha=1 / period, min_periods=period)
+
+    rs = avg_gain / np.where(avg_loss == 0, 1e-10, avg_loss)
+    return pd.Series(100 - (100 / (1 + rs)), index=series.index)
 
 
 def ema(series: pd.Series, length: int = 14) -> pd.Series:
     """
     Exponential moving average.
     """
-    return series.ewm(span=length, adjust=False).mean()
+    arr = _float_values(series)
+    values = _ewma_values(arr, alpha=2.0 / (length + 1), min_periods=1)
+    return pd.Series(values, index=series.index)
 
 
 def bollinger_bands(series: pd.Series, length: int = 20, std: float = 2.0) -> pd.DataFrame:
     """
     Compute upper/middle/lower Bollinger Bands.
+
+    Rolling mean and population std are derived in a single O(n) pass from
+    prefix sums instead of two pandas rolling scans; series containing NaN
+    keep the pandas path so missing-window semantics are unchanged.
     """
-    middle = series.rolling(window=length, min_periods=length).mean()
-    deviation = series.rolling(window=length, min_periods=length).std(ddof=0)
+    arr = series.to_numpy(dtype=np.float64)
+    n = arr.shape[0]
+    if n < length or np.isnan(arr).any():
+        middle = series.rolling(window=length, min_periods=length).mean()
+        deviation = series.rolling(window=length, min_periods=length).std(ddof=0)
+    else:
+        # Shift by the global mean before accumulating to keep the
+        # sum-of-squares cancellation numerically benign for price data.
+        offset = arr.mean()
+        centered = arr - offset
+        csum = np.concatenate(([0.0], np.cumsum(centered)))
+        csum_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+        window_sum = csum[length:] - csum[:-length]
+        window_sum_sq = csum_sq[length:] - csum_sq[:-length]
+        window_mean = window_sum / length
+        variance = np.maximum(window_sum_sq / length - window_mean * window_mean, 0.0)
+
+        middle_arr = np.full(n, np.nan)
+        deviation_arr = np.full(n, np.nan)
+        middle_arr[length - 1 :] = window_mean + offset
+        deviation_arr[length - 1 :] = np.sqrt(variance)
+        middle = pd.Series(middle_arr, index=series.index)
+        deviation = pd.Series(deviation_arr, index=series.index)
+
     upper = middle + std * deviation
     lower = middle - std * deviation
     return pd.DataFrame({"upper": upper, "middle": middle, "lower": lower})
@@ -63,70 +151,78 @@ def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) ->
 # Candlestick Pattern Detection Helpers
 # ────────────────────────────────────────────────
 def detect_doji(df: pd.DataFrame, body_ratio: float = 0.1) -> pd.Series:
-    body = (df["close"] - df["open"]).abs()
-    candle_range = (df["high"] - df["low"]).replace(0, np.nan)
+    body, candle_range, _, _ = _candle_anatomy(df)
 
-    is_doji = (candle_range.notna()) & (body <= candle_range * body_ratio)
-    return is_doji.fillna(False).astype(int)
+    with np.errstate(invalid="ignore"):
+        is_doji = ~np.isnan(candle_range) & (body <= candle_range * body_ratio)
+    return pd.Series(is_doji.astype(int), index=df.index)
 
 
-def detect_hammer(df: pd.DataFrame, shadow_ratio: float = 2.0) -> pd.Series:
-    high, low = df["high"], df["low"]
-    open_, close = df["open"], df["close"]
+def _candle_anatomy(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (body, candle_range, upper_shadow, lower_shadow) as float arrays.
+
+    Computed once on raw ndarrays so the pattern detectors avoid building
+    intermediate two-column frames; zero-range candles yield NaN range.
+    """
+    arrays = OHLCVArrays.from_df(df)
+    o, h, l, c = arrays.open, arrays.high, arrays.low, arrays.close
+
+    body = np.abs(c - o)
+    candle_range = h - l
+    candle_range = np.where(candle_range == 0, np.nan, candle_range)
+    upper_shadow = h - np.maximum(o, c)
+    lower_shadow = np.minimum(o, c) - l
+    return body, candle_range, upper_shadow, lower_shadow
 
-    body = (close - open_).abs()
-    candle_range = (high - low).replace(0, np.nan)
 
-    upper_shadow = high - pd.concat([open_, close], axis=1).max(axis=1)
-    lower_shadow = pd.concat([open_, close], axis=1).min(axis=1) - low
+def detect_hammer(df: pd.DataFrame, shadow_ratio: float = 2.0) -> pd.Series:
+    body, candle_range, upper_shadow, lower_shadow = _candle_anatomy(df)
 
     near_high = upper_shadow <= body
     long_lower_shadow = lower_shadow >= shadow_ratio * body
-    small_body = body <= candle_range * 0.3
+    with np.errstate(invalid="ignore"):
+        small_body = body <= candle_range * 0.3
 
-    mask = candle_range.notna()
-    is_hammer = long_lower_shadow & near_high & small_body & mask
-    return is_hammer.fillna(False).astype(int)
+    is_hammer = long_lower_shadow & near_high & small_body & ~np.isnan(candle_range)
+    return pd.Series(is_hammer.astype(int), index=df.index)
 
 
 def detect_shooting_star(df: pd.DataFrame, shadow_ratio: float = 2.0) -> pd.Series:
-    high, low = df["high"], df["low"]
-    open_, close = df["open"], df["close"]
-
-    body = (close - open_).abs()
-    candle_range = (high - low).replace(0, np.nan)
-
-    upper_shadow = high - pd.concat([open_, close], axis=1).max(axis=1)
-    lower_shadow = pd.concat([open_, close], axis=1).min(axis=1) - low
+    body, candle_range, upper_shadow, lower_shadow = _candle_anatomy(df)
 
     near_low = lower_shadow <= body
     long_upper_shadow = upper_shadow >= shadow_ratio * body
-    small_body = body <= candle_range * 0.3
+    with np.errstate(invalid="ignore"):
+        small_body = body <= candle_range * 0.3
 
-    mask = candle_range.notna()
-    is_shooting_star = long_upper_shadow & near_low & small_body & mask
-    return is_shooting_star.fillna(False).astype(int)
+    is_shooting_star = long_upper_shadow & near_low & small_body & ~np.isnan(candle_range)
+    return pd.Series(is_shooting_star.astype(int), index=df.index)
 
 
 def detect_engulfing(df: pd.DataFrame) -> pd.Series:
-    open_, close = df["open"], df["close"]
-    prev_open, prev_close = open_.shift(1), close.shift(1)
-
-    bullish = (
-        (close > open_)
-        & (prev_close < prev_open)
-        & (close >= prev_open)
-        & (open_ <= prev_close)
-    )
-
-    bearish = (
-        (close < open_)
-        & (prev_close > prev_open)
-        & (open_ >= prev_close)
-        & (close <= prev_open)
-    )
-
-    result = pd.Series(0, index=df.index, dtype="int8")
-    result.loc[bullish] = 1
-    result.loc[bearish] = -1
-    return result
+    arrays = OHLCVArrays.from_df(df)
+    open_, close = arrays.open, arrays.close
+
+    prev_open = np.full_like(open_, np.nan)
+    prev_close = np.full_like(close, np.nan)
+    prev_open[1:] = open_[:-1]
+    prev_close[1:] = close[:-1]
+
+    with np.errstate(invalid="ignore"):
+        bullish = (
+            (close > open_)
+            & (prev_close < prev_open)
+            & (close >= prev_open)
+            & (open_ <= prev_close)
+        )
+
+        bearish = (
+            (close < open_)
+            & (prev_close > prev_open)
+            & (open_ >= prev_close)
+            & (close <= prev_open)
+        )
+
+    result = np.where(bullish, 1, np.where(bearish, -1, 0)).astype(np.int8)
+    return pd.Series(result, index=df.index)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from signalbot.data import get_btc_ohlc
@@ -13,9 +16,12 @@ from signalbot.indicators import (
     detect_hammer,
     detect_shooting_star,
     ema,
-    macd,
 )
-from signalbot.strategy import rsi_signal
+from signalbot.strategy import (
+    SIGNAL_CATEGORIES,
+    SIGNAL_STRENGTH_CATEGORIES,
+    rsi_signal,
+)
 
 
 def run(
@@ -25,12 +31,17 @@ def run(
     overbought: int = 70,
     save: str | None = None,
     lookback_days: int = 365,
+    ohlc: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """
     Execute the RSI strategy pipeline and enrich OHLC data with indicators.
+
+    Pass `ohlc` to reuse already-downloaded candles; callers that cache the
+    fetch separately (e.g. the Streamlit app) avoid hitting the network when
+    only the indicator parameters change.
     """
-    # Fetch market data
-    df = get_btc_ohlc(interval=interval, lookback_days=lookback_days)
+    # Fetch market data unless the caller supplied candles
+    df = ohlc if ohlc is not None else get_btc_ohlc(interval=interval, lookback_days=lookback_days)
 
     # Primary signal calculation
     df = rsi_signal(df, period=period, oversold=oversold, overbought=overbought)
@@ -49,38 +60,39 @@ def run(
         df["bb_upper"] = bb["upper"]
         df["bb_lower"] = bb["lower"]
 
-    # EMAs
+    # EMAs — the 9/21 trend-filter pair replaces the 12/26 columns from
+    # rsi_signal; MACD is not recomputed because rsi_signal already wrote
+    # macd/macd_signal/macd_histogram with identical 12/26/9 parameters.
     df["ema_fast"] = ema(df["close"], length=9)
     df["ema_slow"] = ema(df["close"], length=21)
 
-    # MACD
-    macd_df = macd(df["close"], fast=12, slow=26, signal=9)
-    if not macd_df.empty:
-        df["macd"] = macd_df["macd"]
-        df["macd_signal"] = macd_df["signal"]
-        df["macd_histogram"] = macd_df["histogram"]
-
     # Enforce EMA logic (fast > slow for buys, fast < slow for sells)
     if "signal_strength" not in df.columns:
         df["signal_strength"] = "NEUTRAL"
 
-    buy_mask = df["signal"].isin(["BUY", "STRONG BUY"])
-    sell_mask = df["signal"].isin(["SELL", "STRONG SELL"])
+    buy_mask = df["signal"].isin(["BUY", "STRONG BUY"]).to_numpy()
+    sell_mask = df["signal"].isin(["SELL", "STRONG SELL"]).to_numpy()
 
-    ema_bull = df["ema_fast"] > df["ema_slow"]
-    ema_bear = df["ema_fast"] < df["ema_slow"]
+    ema_bull = (df["ema_fast"] > df["ema_slow"]).to_numpy()
+    ema_bear = (df["ema_fast"] < df["ema_slow"]).to_numpy()
 
-    mismatch_buy = buy_mask & ~ema_bull
-    mismatch_sell = sell_mask & ~ema_bear
+    mismatch = (buy_mask & ~ema_bull) | (sell_mask & ~ema_bear)
 
-    df.loc[mismatch_buy, "signal"] = "HOLD"
-    df.loc[mismatch_buy, "signal_strength"] = "EMA MISMATCH"
+    # Resolve both label columns in one pass over the arrays rather than
+    # four separate masked .loc writes.
+    signal_arr = df["signal"].to_numpy()
+    strength_arr = df["signal_strength"].to_numpy()
 
-    df.loc[mismatch_sell, "signal"] = "HOLD"
-    df.loc[mismatch_sell, "signal_strength"] = "EMA MISMATCH"
+    new_signal = np.where(mismatch, "HOLD", signal_arr)
+    hold_neutral = (new_signal == "HOLD") & (strength_arr == "NEUTRAL")
+    new_strength = np.select(
+        [mismatch, hold_neutral & ema_bull, hold_neutral & ema_bear],
+        ["EMA MISMATCH", "BULLISH", "BEARISH"],
+        default=strength_arr,
+    )
 
-    df.loc[(df["signal"] == "HOLD") & ema_bull & (df["signal_strength"] == "NEUTRAL"), "signal_strength"] = "BULLISH"
-    df.loc[(df["signal"] == "HOLD") & ema_bear & (df["signal_strength"] == "NEUTRAL"), "signal_strength"] = "BEARISH"
+    df["signal"] = pd.Categorical(new_signal, categories=SIGNAL_CATEGORIES)
+    df["signal_strength"] = pd.Categorical(new_strength, categories=SIGNAL_STRENGTH_CATEGORIES)
 
     # Optional CSV export
     if save:
@@ -94,9 +106,64 @@ def run(
     return df
 
 
+def run_many(
+    intervals: list[str],
+    *,
+    period: int = 14,
+    oversold: int = 30,
+    overbought: int = 70,
+    lookback_days: int = 365,
+) -> dict[str, pd.DataFrame]:
+    """
+    Execute the pipeline for several intervals, in parallel processes
+    when more than one is requested.
+
+    Each run is CPU-bound indicator work, so worker processes scale with
+    core count; results are keyed by interval.
+    """
+    if not intervals:
+        raise ValueError("At least one interval is required.")
+
+    kwargs = dict(
+        period=period,
+        oversold=oversold,
+        overbought=overbought,
+        lookback_days=lookback_days,
+    )
+    if len(intervals) == 1:
+        return {intervals[0]: run(interval=intervals[0], **kwargs)}
+
+    results: dict[str, pd.DataFrame] = {}
+    max_workers = min(len(intervals), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run, interval=interval, **kwargs): interval
+            for interval in intervals
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def _print_snapshot(df: pd.DataFrame, interval: str, period: int) -> None:
+    last = df.iloc[-1]
+    print("\nBTC Signal Snapshot")
+    print("-------------------")
+    print(f"Interval: {interval}")
+    print(f"Timestamp: {last.name}")
+    print(f"Close: ${last['close']:.2f}")
+    print(f"RSI({period}): {last['rsi']:.2f}")
+    print(f"Signal: {last['signal']} ({last.get('signal_strength', 'N/A')})")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="BTCSignalBot — RSI Trading Signal Generator")
     parser.add_argument("--interval", default="4h", help="1m,5m,15m,30m,1h,4h,1d")
+    parser.add_argument(
+        "--intervals",
+        default="",
+        help="Comma-separated list of intervals to run in parallel (overrides --interval)",
+    )
     parser.add_argument("--period", type=int, default=14)
     parser.add_argument("--oversold", type=int, default=30)
     parser.add_argument("--overbought", type=int, default=70)
@@ -104,8 +171,25 @@ def main() -> None:
     parser.add_argument("--save", default="", help="Save enriched OHLC data to this CSV path")
     args = parser.parse_args()
 
+    intervals = [item.strip() for item in args.intervals.split(",") if item.strip()]
+    if len(intervals) > 1:
+        frames = run_many(
+            intervals,
+            period=args.period,
+            oversold=args.oversold,
+            overbought=args.overbought,
+            lookback_days=args.lookback_days,
+        )
+        for interval in intervals:
+            df = frames[interval]
+            if args.save:
+                save_path = Path(args.save).expanduser()
+                df.to_csv(save_path.with_stem(f"{save_path.stem}_{interval}"))
+            _print_snapshot(df, interval, args.period)
+        return
+
     df = run(
-        interval=args.interval,
+        interval=intervals[0] if intervals else args.interval,
         period=args.period,
         oversold=args.oversold,
         overbought=args.overbought,
@@ -113,14 +197,7 @@ def main() -> None:
         save=args.save or None,
     )
 
-    last = df.iloc[-1]
-    print("\nBTC Signal Snapshot")
-    print("-------------------")
-    print(f"Interval: {args.interval}")
-    print(f"Timestamp: {last.name}")
-    print(f"Close: ${last['close']:.2f}")
-    print(f"RSI({args.period}): {last['rsi']:.2f}")
-    print(f"Signal: {last['signal']} ({last.get('signal_strength', 'N/A')})")
+    _print_snapshot(df, intervals[0] if intervals else args.interval, args.period)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from ._njit import njit
+
 try:  # Plotly is optional in certain environments
     import plotly.graph_objects as go  # type: ignore[import-untyped]
     from plotly.subplots import make_subplots  # type: ignore[import-untyped]
@@ -14,6 +18,100 @@ except Exception:  # pragma: no cover - exercised only when plotly is absent
     make_subplots = None  # type: ignore[assignment]
     PLOTLY_AVAILABLE = False
 
+try:  # Optional fast JSON encoder for the return_json path
+    import orjson  # type: ignore[import-untyped]
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+# The interactive chart renders without a legend; keeping this off skips
+# per-trace legend metadata and the legend layout block entirely.
+# Trace names are retained because the unified hover labels use them.
+_LEGEND_ENABLED = False
+
+# Rebuilt figures are cached against a fingerprint of the inputs so UI
+# reruns over unchanged data skip the whole trace-construction pass.
+_FIGURE_CACHE_SIZE = 8
+_figure_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def _trades_fingerprint(trades_df: pd.DataFrame | None) -> tuple | None:
+    """
+    Content-based fingerprint for the trades overlay. st.cache_data hands
+    back a freshly unpickled frame each rerun, so object identity never
+    repeats; key on the trade count and the last trade instead.
+    """
+    if trades_df is None:
+        return None
+    if trades_df.empty:
+        return (0,)
+    return (
+        len(trades_df),
+        trades_df["exit_time"].iloc[-1],
+        float(trades_df["pnl_pct"].iloc[-1]),
+    )
+
+
+def _figure_cache_key(
+    df: pd.DataFrame, trades_df: pd.DataFrame | None, *params: Any
+) -> tuple:
+    """
+    Fingerprint the plotted frame cheaply: close prices hashed in one
+    pass plus index endpoints catch both value and window changes.
+    """
+    index = df.index
+    trades_key = _trades_fingerprint(trades_df)
+    return (
+        df.shape[0],
+        hash(df["close"].to_numpy().tobytes()),
+        index[0],
+        index[-1],
+        trades_key,
+        params,
+    )
+
+
+def _marker_positions(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Integer row positions for every marker class in one scan of the
+    signal/divergence columns, shared by both chart builders.
+    """
+    empty = np.array([], dtype=np.intp)
+    if "signal" in df.columns:
+        buy = np.flatnonzero(df["signal"].isin(("BUY", "STRONG BUY")).to_numpy())
+        sell = np.flatnonzero(df["signal"].isin(("SELL", "STRONG SELL")).to_numpy())
+    else:
+        buy = sell = empty
+    if "divergence" in df.columns:
+        bull = np.flatnonzero((df["divergence"] == "BULLISH").to_numpy())
+        bear = np.flatnonzero((df["divergence"] == "BEARISH").to_numpy())
+    else:
+        bull = bear = empty
+    return {"buy": buy, "sell": sell, "bull_div": bull, "bear_div": bear}
+
+
+def _axis_refs(row: int) -> tuple[str, str]:
+    """
+    Plotly axis ids for a make_subplots row (row 1 is unsuffixed).
+    """
+    if row == 1:
+        return "x", "y"
+    return f"x{row}", f"y{row}"
+
+
+@njit(cache=True)
+def _ha_open_kernel(ha_close: np.ndarray, src_open0: float, src_close0: float) -> np.ndarray:  # pragma: no cover - thin numeric kernel
+    n = ha_close.shape[0]
+    out = np.empty(n, dtype=ha_close.dtype)
+    if n == 0:
+        return out
+    out[0] = 0.5 * (src_open0 + src_close0)
+    for i in range(1, n):
+        out[i] = 0.5 * (out[i - 1] + ha_close[i - 1])
+    return out
+
 
 def plot_btc_chart(
     df: pd.DataFrame,
@@ -30,10 +128,81 @@ def plot_btc_chart(
     trades_df: pd.DataFrame | None = None,
     show_rsi: bool = True,
     show_macd: bool = True,
-) -> "go.Figure":
+    return_json: bool = False,
+) -> Any:
     """
     Build a layered Plotly figure with candlesticks plus optional overlays.
+
+    Figures are memoized on a fingerprint of the inputs, so repeated
+    calls with unchanged data (e.g. dashboard reruns) return the cached
+    figure instead of rebuilding every trace. With ``return_json=True``
+    the figure JSON string is produced directly from the trace dicts
+    (via orjson when installed), skipping Figure construction for
+    callers that only need the payload.
     """
+    if df.empty:
+        raise ValueError("Cannot plot BTC chart with an empty dataframe.")
+
+    key = _figure_cache_key(
+        df,
+        trades_df,
+        interval,
+        period,
+        oversold,
+        overbought,
+        show_signals,
+        show_bbands,
+        show_emas,
+        show_divergence,
+        show_backtest_trades,
+        show_rsi,
+        show_macd,
+        return_json,
+    )
+    cached = _figure_cache.get(key)
+    if cached is not None:
+        _figure_cache.move_to_end(key)
+        return cached
+
+    fig = _build_btc_chart(
+        df,
+        interval,
+        period,
+        oversold,
+        overbought,
+        show_signals=show_signals,
+        show_bbands=show_bbands,
+        show_emas=show_emas,
+        show_divergence=show_divergence,
+        show_backtest_trades=show_backtest_trades,
+        trades_df=trades_df,
+        show_rsi=show_rsi,
+        show_macd=show_macd,
+        return_json=return_json,
+    )
+    _figure_cache[key] = fig
+    if len(_figure_cache) > _FIGURE_CACHE_SIZE:
+        _figure_cache.popitem(last=False)
+    return fig
+
+
+def _build_btc_chart(
+    df: pd.DataFrame,
+    interval: str,
+    period: int,
+    oversold: float,
+    overbought: float,
+    *,
+    show_signals: bool,
+    show_bbands: bool,
+    show_emas: bool,
+    show_divergence: bool,
+    show_backtest_trades: bool,
+    trades_df: pd.DataFrame | None,
+    show_rsi: bool,
+    show_macd: bool,
+    return_json: bool,
+) -> Any:
     if not PLOTLY_AVAILABLE:  # pragma: no cover - triggered when plotly missing
         raise RuntimeError("Plotly is not installed; install plotly to render interactive charts.")
 
@@ -75,228 +244,238 @@ def plot_btc_chart(
         elif panel == "macd":
             macd_row = idx
 
-    if df.empty:
-        raise ValueError("Cannot plot BTC chart with an empty dataframe.")
-
-    # Compute Heikin-Ashi candles for a smoother price representation
-    ha_close = (df["open"] + df["high"] + df["low"] + df["close"]) / 4
-    ha_open = ha_close.copy()
-    ha_open_values = ha_open.to_numpy()
-    ha_close_values = ha_close.to_numpy()
+    # Compute Heikin-Ashi candles for a smoother price representation.
+    # Everything stays in raw ndarrays — Plotly accepts them directly,
+    # so no Series headers or index copies are built. The open
+    # recurrence is inherently sequential, so it runs in a compiled
+    # loop rather than a shifted-array approximation.
     source_open = df["open"].to_numpy()
     source_close = df["close"].to_numpy()
-    ha_open_values[0] = (source_open[0] + source_close[0]) / 2
-    if len(ha_open_values) > 1:
-        ha_open_values[1:] = (ha_open_values[:-1] + ha_close_values[:-1]) / 2
-    ha_open = pd.Series(ha_open_values, index=df.index, name="ha_open")
-    ha_high = pd.concat(
-        (df["high"], ha_open, ha_close.rename("ha_close")), axis=1
-    ).max(axis=1)
-    ha_low = pd.concat(
-        (df["low"], ha_open, ha_close.rename("ha_close")), axis=1
-    ).min(axis=1)
+    high_arr = df["high"].to_numpy()
+    low_arr = df["low"].to_numpy()
+    ha_close_values = (source_open + high_arr + low_arr + source_close) * 0.25
+    ha_open_values = _ha_open_kernel(
+        ha_close_values, float(source_open[0]), float(source_close[0])
+    )
+    ha_high = np.maximum(np.maximum(high_arr, ha_open_values), ha_close_values)
+    ha_low = np.minimum(np.minimum(low_arr, ha_open_values), ha_close_values)
+
+    # Traces are assembled as plain dicts with explicit axis references
+    # and attached in one batch; this sidesteps the per-object validator
+    # pass that dominates go.Candlestick/go.Scatter construction.
+    index_values = df.index.to_numpy()
+    traces: list[dict[str, Any]] = []
+    shapes: list[dict[str, Any]] = []
+
+    def add_trace(row: int, **trace: Any) -> None:
+        trace["xaxis"], trace["yaxis"] = _axis_refs(row)
+        traces.append(trace)
+
+    def add_row_shape(row: int, **shape: Any) -> None:
+        # Shape pinned to a subplot: spans the row's x-domain, anchored
+        # to its y-axis. Collected and validated in one batch; the
+        # add_hline/add_hrect helpers also skip subplots whose traces
+        # are not attached yet.
+        xref, yref = _axis_refs(row)
+        shape["xref"] = f"{xref} domain"
+        shape["yref"] = yref
+        shapes.append(shape)
 
     # Price candlesticks (Heikin-Ashi)
-    fig.add_trace(
-        go.Candlestick(
-            x=df.index,
-            open=ha_open,
-            high=ha_high,
-            low=ha_low,
-            close=ha_close,
-            name="Heikin-Ashi",
-            legendgroup="price",
-            showlegend=True,
-            increasing=dict(line=dict(color="#16a34a", width=1.2), fillcolor="rgba(34,197,94,0.68)"),
-            decreasing=dict(line=dict(color="#ef4444", width=1.2), fillcolor="rgba(248,113,113,0.68)"),
-            whiskerwidth=0.4,
-            opacity=0.9,
-        ),
-        row=price_row,
-        col=1,
+    add_trace(
+        price_row,
+        type="candlestick",
+        x=index_values,
+        open=ha_open_values,
+        high=ha_high,
+        low=ha_low,
+        close=ha_close_values,
+        name="Heikin-Ashi",
+        increasing=dict(line=dict(color="#16a34a", width=1.2), fillcolor="rgba(34,197,94,0.68)"),
+        decreasing=dict(line=dict(color="#ef4444", width=1.2), fillcolor="rgba(248,113,113,0.68)"),
+        whiskerwidth=0.4,
+        opacity=0.9,
     )
 
-    # Buy/Sell markers
+    # Buy/Sell markers. Marker rows are subsets of df itself, so
+    # positional gathers on the HA close array replace the per-trace
+    # hash-join that ha_close.reindex(...) would run.
+    markers = _marker_positions(df)
     if show_signals and "signal" in df.columns:
-        buys = df[df["signal"].str.contains("BUY", na=False)]
-        sells = df[df["signal"].str.contains("SELL", na=False)]
-
-        fig.add_trace(
-            go.Scatter(
-                x=buys.index,
-                y=ha_close.reindex(buys.index),
-                mode="markers",
-                marker=dict(symbol="triangle-up", color="#22c55e", size=10),
-                name="Buy",
-            ),
-            row=price_row,
-            col=1,
+        add_trace(
+            price_row,
+            type="scatter",
+            x=index_values[markers["buy"]],
+            y=ha_close_values[markers["buy"]],
+            mode="markers",
+            marker=dict(symbol="triangle-up", color="#22c55e", size=10),
+            name="Buy",
         )
-        fig.add_trace(
-            go.Scatter(
-                x=sells.index,
-                y=ha_close.reindex(sells.index),
-                mode="markers",
-                marker=dict(symbol="triangle-down", color="#ef4444", size=10),
-                name="Sell",
-            ),
-            row=price_row,
-            col=1,
+        add_trace(
+            price_row,
+            type="scatter",
+            x=index_values[markers["sell"]],
+            y=ha_close_values[markers["sell"]],
+            mode="markers",
+            marker=dict(symbol="triangle-down", color="#ef4444", size=10),
+            name="Sell",
         )
 
-    # Backtest trade markers
+    # Backtest trade markers. Trade timestamps are mapped to frame
+    # positions in one hash probe; timestamps outside the frame fall
+    # back to the recorded trade price, matching the old
+    # reindex(...).fillna(...) without two Series alignments.
     if show_backtest_trades and trades_df is not None and not trades_df.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=trades_df["entry_time"],
-                y=ha_close.reindex(trades_df["entry_time"]).fillna(trades_df["entry_price"]),
-                mode="markers",
-                marker=dict(symbol="triangle-up", color="#bef264", size=12),
-                name="Backtest Entry",
-            ),
-            row=price_row,
-            col=1,
+
+        def _trade_marker_y(times: pd.Series, fallback_prices: pd.Series) -> np.ndarray:
+            pos = df.index.get_indexer(times)
+            return np.where(
+                pos >= 0, ha_close_values[np.maximum(pos, 0)], fallback_prices.to_numpy()
+            )
+
+        add_trace(
+            price_row,
+            type="scatter",
+            x=trades_df["entry_time"].to_numpy(),
+            y=_trade_marker_y(trades_df["entry_time"], trades_df["entry_price"]),
+            mode="markers",
+            marker=dict(symbol="triangle-up", color="#bef264", size=12),
+            name="Backtest Entry",
         )
-        fig.add_trace(
-            go.Scatter(
-                x=trades_df["exit_time"],
-                y=ha_close.reindex(trades_df["exit_time"]).fillna(trades_df["exit_price"]),
-                mode="markers",
-                marker=dict(symbol="triangle-down", color="#facc15", size=12),
-                name="Backtest Exit",
-            ),
-            row=price_row,
-            col=1,
+        add_trace(
+            price_row,
+            type="scatter",
+            x=trades_df["exit_time"].to_numpy(),
+            y=_trade_marker_y(trades_df["exit_time"], trades_df["exit_price"]),
+            mode="markers",
+            marker=dict(symbol="triangle-down", color="#facc15", size=12),
+            name="Backtest Exit",
         )
 
     # Divergence highlights
     if show_divergence and "divergence" in df.columns:
-        bull = df[df["divergence"] == "BULLISH"]
-        bear = df[df["divergence"] == "BEARISH"]
-
-        if not bull.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=bull.index,
-                    y=ha_close.reindex(bull.index),
-                    mode="markers",
-                    marker=dict(symbol="star", color="#22c55e", size=12),
-                    name="Bullish Divergence",
-                ),
-                row=price_row,
-                col=1,
+        if markers["bull_div"].size:
+            add_trace(
+                price_row,
+                type="scatter",
+                x=index_values[markers["bull_div"]],
+                y=ha_close_values[markers["bull_div"]],
+                mode="markers",
+                marker=dict(symbol="star", color="#22c55e", size=12),
+                name="Bullish Divergence",
             )
-        if not bear.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=bear.index,
-                    y=ha_close.reindex(bear.index),
-                    mode="markers",
-                    marker=dict(symbol="star", color="#f97316", size=12),
-                    name="Bearish Divergence",
-                ),
-                row=price_row,
-                col=1,
+        if markers["bear_div"].size:
+            add_trace(
+                price_row,
+                type="scatter",
+                x=index_values[markers["bear_div"]],
+                y=ha_close_values[markers["bear_div"]],
+                mode="markers",
+                marker=dict(symbol="star", color="#f97316", size=12),
+                name="Bearish Divergence",
             )
 
     # Bollinger Bands
     if show_bbands and {"bb_upper", "bb_lower"} <= set(df.columns):
         band_df = df[["bb_upper", "bb_lower"]].dropna()
         if not band_df.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=band_df.index,
-                    y=band_df["bb_upper"],
-                    mode="lines",
-                    line=dict(color="rgba(59, 130, 246, 0.8)", width=1.2),
-                    name="Bollinger Upper",
-                    hoverinfo="x+y+name",
-                ),
-                row=price_row,
-                col=1,
+            band_index = band_df.index.to_numpy()
+            add_trace(
+                price_row,
+                type="scatter",
+                x=band_index,
+                y=band_df["bb_upper"].to_numpy(),
+                mode="lines",
+                line=dict(color="rgba(59, 130, 246, 0.8)", width=1.2),
+                name="Bollinger Upper",
+                hoverinfo="x+y+name",
             )
-            fig.add_trace(
-                go.Scatter(
-                    x=band_df.index,
-                    y=band_df["bb_lower"],
-                    mode="lines",
-                    line=dict(color="rgba(59, 130, 246, 0.8)", width=1.2),
-                    name="Bollinger Lower",
-                    hoverinfo="x+y+name",
-                    fill="tonexty",
-                    fillcolor="rgba(59, 130, 246, 0.12)",
-                ),
-                row=price_row,
-                col=1,
+            add_trace(
+                price_row,
+                type="scatter",
+                x=band_index,
+                y=band_df["bb_lower"].to_numpy(),
+                mode="lines",
+                line=dict(color="rgba(59, 130, 246, 0.8)", width=1.2),
+                name="Bollinger Lower",
+                hoverinfo="x+y+name",
+                fill="tonexty",
+                fillcolor="rgba(59, 130, 246, 0.12)",
             )
 
     # EMAs
     if show_emas and {"ema_fast", "ema_slow"} <= set(df.columns):
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["ema_fast"],
-                mode="lines",
-                line=dict(color="#fb7185", width=1.5),
-                name="EMA Fast",
-            ),
-            row=price_row,
-            col=1,
+        add_trace(
+            price_row,
+            type="scatter",
+            x=index_values,
+            y=df["ema_fast"].to_numpy(),
+            mode="lines",
+            line=dict(color="#fb7185", width=1.5),
+            name="EMA Fast",
         )
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["ema_slow"],
-                mode="lines",
-                line=dict(color="#a855f7", width=1.5),
-                name="EMA Slow",
-            ),
-            row=price_row,
-            col=1,
+        add_trace(
+            price_row,
+            type="scatter",
+            x=index_values,
+            y=df["ema_slow"].to_numpy(),
+            mode="lines",
+            line=dict(color="#a855f7", width=1.5),
+            name="EMA Slow",
         )
 
     # RSI subplot
     if show_rsi and rsi_row and "rsi" in df.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["rsi"],
-                mode="lines",
-                line=dict(color="#f97316"),
-                name=f"RSI ({period})",
-            ),
-            row=rsi_row,
-            col=1,
+        add_trace(
+            rsi_row,
+            type="scatter",
+            x=index_values,
+            y=df["rsi"].to_numpy(),
+            mode="lines",
+            line=dict(color="#f97316"),
+            name=f"RSI ({period})",
+        )
+        add_row_shape(
+            rsi_row,
+            type="line",
+            x0=0,
+            x1=1,
+            y0=overbought,
+            y1=overbought,
+            line=dict(color="#ef4444", dash="dot"),
+        )
+        add_row_shape(
+            rsi_row,
+            type="line",
+            x0=0,
+            x1=1,
+            y0=oversold,
+            y1=oversold,
+            line=dict(color="#22c55e", dash="dot"),
         )
-        fig.add_hline(y=overbought, line=dict(color="#ef4444", dash="dot"), row=rsi_row, col=1)
-        fig.add_hline(y=oversold, line=dict(color="#22c55e", dash="dot"), row=rsi_row, col=1)
 
     # MACD subplot
     if show_macd and macd_row and {"macd", "macd_signal"} <= set(df.columns):
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["macd"],
-                mode="lines",
-                line=dict(color="#22c55e"),
-                name="MACD",
-            ),
-            row=macd_row,
-            col=1,
+        add_trace(
+            macd_row,
+            type="scatter",
+            x=index_values,
+            y=df["macd"].to_numpy(),
+            mode="lines",
+            line=dict(color="#22c55e"),
+            name="MACD",
         )
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["macd_signal"],
-                mode="lines",
-                line=dict(color="#ef4444"),
-                name="Signal",
-            ),
-            row=macd_row,
-            col=1,
+        add_trace(
+            macd_row,
+            type="scatter",
+            x=index_values,
+            y=df["macd_signal"].to_numpy(),
+            mode="lines",
+            line=dict(color="#ef4444"),
+            name="Signal",
         )
 
-    fig.update_layout(
+    layout_kwargs: dict[str, Any] = dict(
         height=fig_height,
         title=dict(
             text=f"BTC/USD · {interval.upper()} Heikin-Ashi",
@@ -308,7 +487,13 @@ def plot_btc_chart(
         plot_bgcolor="#0b152c",
         font=dict(family="Inter, sans-serif", color="#e2e8f0"),
         xaxis_rangeslider_visible=False,
-        legend=dict(
+        showlegend=_LEGEND_ENABLED,
+        margin=dict(l=24, r=120, t=70, b=40),
+        hovermode="x unified",
+        hoverlabel=dict(bgcolor="#121f3b", font=dict(color="#e2e8f0")),
+    )
+    if _LEGEND_ENABLED:
+        layout_kwargs["legend"] = dict(
             orientation="v",
             yanchor="top",
             y=0.98,
@@ -320,11 +505,8 @@ def plot_btc_chart(
             borderwidth=1,
             itemclick="toggle",
             itemdoubleclick="toggleothers",
-        ),
-        margin=dict(l=24, r=120, t=70, b=40),
-        hovermode="x unified",
-        hoverlabel=dict(bgcolor="#121f3b", font=dict(color="#e2e8f0")),
-    )
+        )
+    fig.update_layout(**layout_kwargs)
 
     subplot_backgrounds: list[tuple[int, str]] = [
         (price_row, "rgba(11,23,45,0.86)"),
@@ -339,17 +521,19 @@ def plot_btc_chart(
         axis = getattr(fig.layout, axis_key, None)
         domain = getattr(axis, "domain", None)
         if domain:
-            fig.add_shape(
-                type="rect",
-                x0=0,
-                x1=1,
-                y0=domain[0],
-                y1=domain[1],
-                xref="paper",
-                yref="paper",
-                fillcolor=color,
-                layer="below",
-                line_width=0,
+            shapes.append(
+                dict(
+                    type="rect",
+                    x0=0,
+                    x1=1,
+                    y0=domain[0],
+                    y1=domain[1],
+                    xref="paper",
+                    yref="paper",
+                    fillcolor=color,
+                    layer="below",
+                    line=dict(width=0),
+                )
             )
 
     fig.update_xaxes(
@@ -395,23 +579,27 @@ def plot_btc_chart(
             row=rsi_row,
             col=1,
         )
-        fig.add_hrect(
+        add_row_shape(
+            rsi_row,
+            type="rect",
+            x0=0,
+            x1=1,
             y0=0,
             y1=oversold,
             fillcolor="rgba(34,197,94,0.12)",
             layer="below",
-            line_width=0,
-            row=rsi_row,
-            col=1,
+            line=dict(width=0),
         )
-        fig.add_hrect(
+        add_row_shape(
+            rsi_row,
+            type="rect",
+            x0=0,
+            x1=1,
             y0=overbought,
             y1=100,
             fillcolor="rgba(239,68,68,0.12)",
             layer="below",
-            line_width=0,
-            row=rsi_row,
-            col=1,
+            line=dict(width=0),
         )
         fig.update_xaxes(
             showgrid=True,
@@ -435,16 +623,19 @@ def plot_btc_chart(
             row=macd_row,
             col=1,
         )
-        fig.add_hline(
-            y=0,
+        add_row_shape(
+            macd_row,
+            type="line",
+            x0=0,
+            x1=1,
+            y0=0,
+            y1=0,
             line=dict(color="#60a5fa", width=1, dash="dot"),
-            row=macd_row,
-            col=1,
         )
 
     # Highlight the latest closing price similar to trading terminals
     if not df.empty:
-        last_close = ha_close.iloc[-1]
+        last_close = float(ha_close_values[-1])
         fig.add_annotation(
             x=1.01,
             y=last_close,
@@ -460,7 +651,19 @@ def plot_btc_chart(
             showarrow=False,
         )
 
-    fig.update_layout(showlegend=False)
+    # All threshold lines, RSI zone rects and subplot backgrounds are
+    # validated in this single layout assignment.
+    if shapes:
+        fig.update_layout(shapes=shapes)
+
+    if return_json:
+        payload = {"data": traces, "layout": fig.to_plotly_json()["layout"]}
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        fig.add_traces(traces)
+        return fig.to_json()
+
+    fig.add_traces(traces)
     return fig
 
 
@@ -471,6 +674,21 @@ def plot_equity_curve(equity: pd.Series, trades_df: pd.DataFrame | None = None)
     if not PLOTLY_AVAILABLE:  # pragma: no cover - triggered when plotly missing
         raise RuntimeError("Plotly is not installed; install plotly to render interactive charts.")
 
+    # Same memoization scheme as plot_btc_chart: dashboard reruns with an
+    # unchanged equity series reuse the built figure.
+    key = (
+        "equity",
+        equity.shape[0],
+        hash(equity.to_numpy().tobytes()),
+        equity.index[0] if len(equity) else None,
+        equity.index[-1] if len(equity) else None,
+        _trades_fingerprint(trades_df),
+    )
+    cached = _figure_cache.get(key)
+    if cached is not None:
+        _figure_cache.move_to_end(key)
+        return cached
+
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -483,13 +701,22 @@ def plot_equity_curve(equity: pd.Series, trades_df: pd.DataFrame | None = None)
     )
 
     if trades_df is not None and not trades_df.empty:
-        entry_equity = equity.reindex(trades_df["entry_time"]).ffill()
-        exit_equity = equity.reindex(trades_df["exit_time"]).ffill()
+        if equity.index.is_monotonic_increasing:
+            # As-of lookup via one indexer probe; trade timestamps come
+            # from the same index, so this matches the reindex path.
+            equity_values = equity.to_numpy()
+            entry_pos = equity.index.get_indexer(trades_df["entry_time"], method="ffill")
+            exit_pos = equity.index.get_indexer(trades_df["exit_time"], method="ffill")
+            entry_equity = equity_values[np.maximum(entry_pos, 0)]
+            exit_equity = equity_values[np.maximum(exit_pos, 0)]
+        else:
+            entry_equity = equity.reindex(trades_df["entry_time"]).ffill().to_numpy()
+            exit_equity = equity.reindex(trades_df["exit_time"]).ffill().to_numpy()
 
         fig.add_trace(
             go.Scatter(
                 x=trades_df["entry_time"],
-                y=entry_equity.values,
+                y=entry_equity,
                 mode="markers",
                 marker=dict(symbol="triangle-up", color="#34d399", size=9),
                 name="Entry",
@@ -498,7 +725,7 @@ def plot_equity_curve(equity: pd.Series, trades_df: pd.DataFrame | None = None)
         fig.add_trace(
             go.Scatter(
                 x=trades_df["exit_time"],
-                y=exit_equity.values,
+                y=exit_equity,
                 mode="markers",
                 marker=dict(symbol="triangle-down", color="#f87171", size=9),
                 name="Exit",
@@ -513,6 +740,9 @@ def plot_equity_curve(equity: pd.Series, trades_df: pd.DataFrame | None = None)
         template="plotly_white",
         margin=dict(l=20, r=20, t=60, b=40),
     )
+    _figure_cache[key] = fig
+    if len(_figure_cache) > _FIGURE_CACHE_SIZE:
+        _figure_cache.popitem(last=False)
     return fig
 
 
@@ -534,7 +764,18 @@ def plot_btc_chart_altair(
     except Exception as exc:  # pragma: no cover - optional dependency
         raise RuntimeError("Altair is required for the fallback chart but is not installed.") from exc
 
-    frame = df.copy().reset_index().rename(columns={df.index.name or "index": "timestamp"})
+    # Altair's default transformer refuses frames above 5,000 rows, and this
+    # builder is exactly the path large windows are routed down.
+    alt.data_transformers.disable_max_rows()
+
+    # reset_index already returns a fresh frame, so no copy is needed;
+    # only the columns the chart consumes are shipped to Vega-Lite.
+    chart_columns = [
+        col
+        for col in ("close", "volume", "ema_fast", "ema_slow", "bb_upper", "bb_lower", "signal")
+        if col in df.columns
+    ]
+    frame = df[chart_columns].reset_index().rename(columns={df.index.name or "index": "timestamp"})
     if "timestamp" not in frame.columns:
         frame = frame.rename(columns={frame.columns[0]: "timestamp"})
 
@@ -566,8 +807,9 @@ def plot_btc_chart_altair(
         )
 
     if show_signals and "signal" in frame.columns:
-        buys = frame[frame["signal"].str.contains("BUY", na=False)]
-        sells = frame[frame["signal"].str.contains("SELL", na=False)]
+        markers = _marker_positions(frame)
+        buys = frame.iloc[markers["buy"]]
+        sells = frame.iloc[markers["sell"]]
         if not buys.empty:
             layers.append(
                 alt.Chart(buys)
@@ -597,6 +839,8 @@ def plot_equity_curve_altair(equity: pd.Series) -> Any:
     except Exception as exc:  # pragma: no cover - optional dependency
         raise RuntimeError("Altair is required for the fallback equity chart but is not installed.") from exc
 
+    alt.data_transformers.disable_max_rows()
+
     frame = equity.reset_index()
     frame.columns = ["timestamp", "equity"]
 
@@ -1,9 +1,64 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from ._njit import njit
 from .indicators import ema, macd, rsi
 
+# Fixed label vocabularies; stored as categoricals so each row costs one
+# int8 code instead of a Python string object.
+SIGNAL_CATEGORIES = ["HOLD", "BUY", "SELL", "STRONG BUY", "STRONG SELL"]
+SIGNAL_STRENGTH_CATEGORIES = ["NEUTRAL", "BUY", "SELL", "BULLISH", "BEARISH", "EMA MISMATCH"]
+DIVERGENCE_CATEGORIES = ["BULLISH", "BEARISH"]
+
+
+@njit(cache=True)
+def _classify_kernel(
+    rsi_arr: np.ndarray,
+    macd_arr: np.ndarray,
+    macd_sig_arr: np.ndarray,
+    ema_fast_arr: np.ndarray,
+    ema_slow_arr: np.ndarray,
+    oversold: float,
+    overbought: float,
+) -> tuple[np.ndarray, np.ndarray]:  # pragma: no cover - thin numeric kernel
+    n = rsi_arr.shape[0]
+    signal_codes = np.zeros(n, dtype=np.int8)
+    strength_codes = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        # NaN comparisons are False, which gates warm-up bars exactly
+        # like the notna() checks in the mask formulation.
+        macd_cross_up = (
+            macd_arr[i - 1] < macd_sig_arr[i - 1] and macd_arr[i] > macd_sig_arr[i]
+        )
+        macd_cross_down = (
+            macd_arr[i - 1] > macd_sig_arr[i - 1] and macd_arr[i] < macd_sig_arr[i]
+        )
+        if (
+            rsi_arr[i - 1] < oversold
+            and rsi_arr[i] >= oversold
+            and ema_fast_arr[i] > ema_slow_arr[i]
+        ):
+            if macd_cross_up:
+                signal_codes[i] = 3  # STRONG BUY
+                strength_codes[i] = 3  # BULLISH
+            else:
+                signal_codes[i] = 1  # BUY
+                strength_codes[i] = 1  # BUY
+        elif (
+            rsi_arr[i - 1] > overbought
+            and rsi_arr[i] <= overbought
+            and ema_fast_arr[i] < ema_slow_arr[i]
+        ):
+            if macd_cross_down:
+                signal_codes[i] = 4  # STRONG SELL
+                strength_codes[i] = 4  # BEARISH
+            else:
+                signal_codes[i] = 2  # SELL
+                strength_codes[i] = 2  # SELL
+    return signal_codes, strength_codes
+
 
 def rsi_signal(
     df: pd.DataFrame,
@@ -22,7 +77,19 @@ def rsi_signal(
     if df.empty:
         return df.copy()
 
-    out = df.copy().sort_index()
+    # Callers usually pass frames that are already time-ordered; only
+    # unsorted input pays for the sort. sort_index returns a fresh frame,
+    # and the shallow copy relies on copy-on-write for the added columns.
+    if df.index.is_monotonic_increasing:
+        out = df.copy(deep=False)
+    else:
+        out = df.sort_index()
+
+    # float32 carries ~7 significant digits — ample for BTC prices — and
+    # halves the bandwidth of every downstream indicator pass and the
+    # serialized chart payload.
+    price_cols = [col for col in ("open", "high", "low", "close") if col in out.columns]
+    out[price_cols] = out[price_cols].astype(np.float32)
 
     # Core indicator suite
     out["rsi"] = rsi(out["close"], period=period)
@@ -42,51 +109,40 @@ def rsi_signal(
     out["macd_signal"] = macd_df["signal"]
     out["macd_histogram"] = macd_df["histogram"]
 
-    prev_rsi = out["rsi"].shift(1)
-    rsi_cross_up = (prev_rsi < oversold) & (out["rsi"] >= oversold)
-    rsi_cross_down = (prev_rsi > overbought) & (out["rsi"] <= overbought)
-
-    prev_macd = out["macd"].shift(1)
-    prev_signal = out["macd_signal"].shift(1)
-    macd_cross_up = (prev_macd < prev_signal) & (out["macd"] > out["macd_signal"])
-    macd_cross_down = (prev_macd > prev_signal) & (out["macd"] < out["macd_signal"])
-
-    ema_uptrend = out["ema_fast"] > out["ema_slow"]
-    ema_downtrend = out["ema_fast"] < out["ema_slow"]
-
-    out["signal"] = "HOLD"
-    out["signal_strength"] = "NEUTRAL"
-
-    buy_mask = rsi_cross_up & ema_uptrend & out["rsi"].notna() & prev_rsi.notna()
-    sell_mask = rsi_cross_down & ema_downtrend & out["rsi"].notna() & prev_rsi.notna()
-
-    out.loc[buy_mask, "signal"] = "BUY"
-    out.loc[sell_mask, "signal"] = "SELL"
-    out.loc[buy_mask, "signal_strength"] = "BUY"
-    out.loc[sell_mask, "signal_strength"] = "SELL"
-
-    strong_buy = buy_mask & macd_cross_up
-    strong_sell = sell_mask & macd_cross_down
-
-    out.loc[strong_buy, "signal"] = "STRONG BUY"
-    out.loc[strong_sell, "signal"] = "STRONG SELL"
-    out.loc[strong_buy, "signal_strength"] = "BULLISH"
-    out.loc[strong_sell, "signal_strength"] = "BEARISH"
-
-    # Simple divergence heuristic for additional context
-    out["divergence"] = None
-    price = out["close"]
-    rsi_vals = out["rsi"]
-
-    higher_high = (price > price.shift(1)) & (price.shift(1) > price.shift(2))
-    lower_high = (rsi_vals < rsi_vals.shift(1)) & (rsi_vals.shift(1) < rsi_vals.shift(2))
-    bearish_div = higher_high & lower_high
-
-    lower_low = (price < price.shift(1)) & (price.shift(1) < price.shift(2))
-    higher_low = (rsi_vals > rsi_vals.shift(1)) & (rsi_vals.shift(1) > rsi_vals.shift(2))
-    bullish_div = lower_low & higher_low
-
-    out.loc[bearish_div, "divergence"] = "BEARISH"
-    out.loc[bullish_div, "divergence"] = "BULLISH"
+    # RSI/MACD crossovers, the EMA trend gate, and the strong-signal
+    # upgrade are fused into one compiled pass instead of a chain of
+    # shifted-Series masks, each of which allocates a full bool array.
+    signal_codes, strength_codes = _classify_kernel(
+        np.ascontiguousarray(out["rsi"].to_numpy(dtype=np.float64, copy=False)),
+        np.ascontiguousarray(out["macd"].to_numpy(dtype=np.float64, copy=False)),
+        np.ascontiguousarray(out["macd_signal"].to_numpy(dtype=np.float64, copy=False)),
+        np.ascontiguousarray(ema_fast.to_numpy(dtype=np.float64, copy=False)),
+        np.ascontiguousarray(ema_slow.to_numpy(dtype=np.float64, copy=False)),
+        float(oversold),
+        float(overbought),
+    )
+    out["signal"] = pd.Categorical.from_codes(signal_codes, categories=SIGNAL_CATEGORIES)
+    out["signal_strength"] = pd.Categorical.from_codes(
+        strength_codes, categories=SIGNAL_STRENGTH_CATEGORIES
+    )
+
+    # Simple divergence heuristic for additional context. The 3-bar
+    # pattern checks run on raw slices of the close/RSI arrays instead
+    # of four shifted Series, so no padded intermediates are allocated.
+    p = out["close"].to_numpy(dtype=np.float64, copy=False)
+    r = out["rsi"].to_numpy(dtype=np.float64, copy=False)
+
+    divergence_codes = np.full(len(out), -1, dtype=np.int8)
+    if p.size >= 3:
+        higher_high = (p[2:] > p[1:-1]) & (p[1:-1] > p[:-2])
+        lower_high = (r[2:] < r[1:-1]) & (r[1:-1] < r[:-2])
+        divergence_codes[2:][higher_high & lower_high] = DIVERGENCE_CATEGORIES.index("BEARISH")
+
+        lower_low = (p[2:] < p[1:-1]) & (p[1:-1] < p[:-2])
+        higher_low = (r[2:] > r[1:-1]) & (r[1:-1] > r[:-2])
+        divergence_codes[2:][lower_low & higher_low] = DIVERGENCE_CATEGORIES.index("BULLISH")
+    out["divergence"] = pd.Categorical.from_codes(
+        divergence_codes, categories=DIVERGENCE_CATEGORIES
+    )
 
     return out
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import io
 import math
+import string
 import sys
 import traceback
-import uuid
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pandas as pd
 import streamlit as st
+import streamlit.components.v1 as components
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -22,539 +25,134 @@ st.set_page_config(
     layout="wide",
 )
 
-st.markdown(
-    """
-    <style>
-    .stSlider > div[data-baseweb="slider"] > div {
-        padding-top: 0.5rem;
-        padding-bottom: 1.2rem;
-    }
-    .stCheckbox {
-        margin-bottom: 0.3rem;
-    }
-    .stSelectbox > div {
-        margin-bottom: 1.2rem;
-    }
-    .stExpander {
-        border: 1px solid rgba(250, 250, 250, 0.1);
-        border-radius: 8px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-CUSTOM_CSS = """
+WIDGET_CSS = """
 <style>
-:root {
-    --surface-bg: #f8fafc;
-    --border-soft: #e2e8f0;
-    --accent: #2563eb;
-    --text-strong: #0f172a;
-    --text-muted: #64748b;
-}
-.hero {
-    background: linear-gradient(135deg, #0f172a, #2563eb);
-    color: #f8fafc;
-    padding: 1.4rem 1.7rem;
-    border-radius: 18px;
-    margin-bottom: 1.2rem;
-}
-.hero h1 {
-    margin: 0;
-    font-size: 1.95rem;
-    font-weight: 700;
-    color: #ffffff;
-}
-.hero p {
-    margin: 0.45rem 0 0;
-    font-size: 1.02rem;
-    color: #e2e8f0;
-}
-.metric-card {
-    background: #ffffff;
-    border-radius: 16px;
-    padding: 1rem 1.2rem;
-    border: 1px solid var(--border-soft);
-    box-shadow: 0 4px 14px rgba(15, 23, 42, 0.06);
-    transition: box-shadow 0.2s ease, transform 0.2s ease;
-}
-.metric-label {
-    display: flex;
-    align-items: center;
-    gap: 0.45rem;
-    font-size: 0.78rem;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    color: var(--text-muted);
-}
-.metric-value {
-    margin-top: 0.45rem;
-    font-size: 1.7rem;
-    font-weight: 700;
-    color: var(--text-strong);
-}
-.metric-delta {
-    margin-top: 0.35rem;
-    display: inline-block;
-    font-weight: 600;
-    font-size: 0.9rem;
-}
-.metric-card-flash {
-    animation: metric-flash 0.9s ease-in-out;
-}
-@keyframes metric-flash {
-    0% {
-        box-shadow: 0 0 0 rgba(56, 189, 248, 0.0);
-    }
-    35% {
-        box-shadow: 0 0 0 10px rgba(56, 189, 248, 0.18);
-    }
-    100% {
-        box-shadow: 0 0 0 rgba(56, 189, 248, 0.0);
-    }
-}
-.metric-delta.positive {
-    color: #16a34a;
-}
-.metric-delta.negative {
-    color: #dc2626;
-}
-.metric-delta.neutral {
-    color: #94a3b8;
-}
-.metric-badge {
-    padding: 0.18rem 0.6rem;
-    border-radius: 999px;
-    background: #e0f2fe;
-    color: #0c4a6e;
-    font-size: 0.75rem;
-    font-weight: 600;
-    border: 1px solid rgba(14, 165, 233, 0.35);
-}
-.metric-card.metric-card-signal {
-    min-height: 148px;
-    display: flex;
-    flex-direction: column;
-    justify-content: center;
-    gap: 0.55rem;
-    border: none;
-    box-shadow: 0 14px 30px rgba(15, 23, 42, 0.2);
-}
-.metric-card.metric-card-signal .metric-label,
-.metric-card.metric-card-signal .metric-value,
-.metric-card.metric-card-signal .metric-delta {
-    color: rgba(248, 250, 252, 0.92);
-}
-.metric-card.metric-card-signal .metric-label strong {
-    color: inherit;
-}
-.metric-card.metric-card-signal .metric-badge {
-    background: rgba(15, 23, 42, 0.32);
-    color: #f8fafc;
-    border-color: rgba(241, 245, 249, 0.3);
-}
-.metric-card.metric-card-signal.signal-buy {
-    background: linear-gradient(135deg, #14532d, #22c55e);
-}
-.metric-card.metric-card-signal.signal-sell {
-    background: linear-gradient(135deg, #7f1d1d, #ef4444);
-}
-.metric-card.metric-card-signal.signal-hold {
-    background: linear-gradient(135deg, #1e293b, #64748b);
-}
-.metric-card.metric-card-signal.signal-hold .metric-badge {
-    background: rgba(15, 23, 42, 0.3);
-}
-.metric-card.metric-card-signal.signal-buy .metric-badge {
-    border-color: rgba(187, 247, 208, 0.45);
-}
-.metric-card.metric-card-signal.signal-sell .metric-badge {
-    border-color: rgba(254, 202, 202, 0.4);
-}
-.chip-row {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 0.6rem;
-    margin: 0.1rem 0 1.3rem;
-}
-.chip {
-    padding: 0.4rem 0.75rem;
-    border-radius: 999px;
-    border: 1px solid;
-    font-size: 0.85rem;
-    display: inline-flex;
-    align-items: center;
-    gap: 0.45rem;
-}
-.chip-on {
-    background: #e0f2fe;
-    color: #075985;
-    border-color: #38bdf8;
-}
-.chip-off {
-    background: #f8fafc;
-    color: #94a3b8;
-    border-color: #e2e8f0;
-}
-.chip strong {
-    font-weight: 600;
-}
-.backtest-summary {
-    background: linear-gradient(130deg, #0f172a, #1e3a8a);
-    color: #f8fafc;
-    padding: 1.1rem 1.4rem;
-    border-radius: 18px;
-    margin: 1rem 0 1.4rem;
-    border: 1px solid rgba(148, 163, 184, 0.25);
-    box-shadow: 0 12px 28px rgba(15, 23, 42, 0.25);
-}
-.backtest-summary h3 {
-    margin: 0;
-    font-size: 1.35rem;
-    font-weight: 700;
-}
-.backtest-summary p {
-    margin: 0.6rem 0 0.9rem;
-    font-size: 0.98rem;
-    line-height: 1.5;
-    color: #e2e8f0;
-}
-.summary-chip {
-    display: inline-flex;
-    align-items: center;
-    gap: 0.45rem;
-    padding: 0.35rem 0.85rem;
-    border-radius: 999px;
-    font-size: 0.82rem;
-    font-weight: 600;
-    border: 1px solid rgba(226, 232, 240, 0.35);
-    background: rgba(15, 23, 42, 0.35);
-    color: #f8fafc;
-}
-.summary-chip.positive {
-    background: rgba(22, 163, 74, 0.18);
-    color: #bbf7d0;
-    border-color: rgba(34, 197, 94, 0.45);
-}
-.summary-chip.negative {
-    background: rgba(220, 38, 38, 0.18);
-    color: #fecaca;
-    border-color: rgba(248, 113, 113, 0.45);
-}
-.backtest-steps {
-    display: grid;
-    gap: 0.85rem;
-    margin: 1.2rem 0 1.5rem;
-}
-.step-card {
-    background: #ffffff;
-    border-radius: 14px;
-    padding: 0.95rem 1.05rem;
-    border: 1px solid var(--border-soft);
-    box-shadow: 0 6px 18px rgba(15, 23, 42, 0.05);
-}
-.step-card h4 {
-    margin: 0 0 0.35rem;
-    font-size: 0.95rem;
-    color: var(--text-strong);
-}
-.step-card p {
-    margin: 0;
-    color: var(--text-muted);
-    font-size: 0.86rem;
-    line-height: 1.5;
-}
-.metric-section-title {
-    margin: 1.2rem 0 0.8rem;
-    font-size: 1.05rem;
-    font-weight: 700;
-    color: #0f172a;
-}
-.data-output-title {
-    margin: 2rem 0 0.7rem;
-    font-size: 1.05rem;
-    font-weight: 700;
-    color: #0f172a;
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
-.overlay-active-badge {
-    display: flex;
-    justify-content: flex-end;
-    align-items: center;
-    gap: 0.45rem;
-    margin-bottom: 0.55rem;
-    flex-wrap: wrap;
-}
-.overlay-active-badge span {
-    background: rgba(56, 189, 248, 0.15);
-    color: #38bdf8;
-    border-radius: 999px;
-    padding: 0.25rem 0.65rem;
-    font-size: 0.78rem;
-    font-weight: 600;
-    border: 1px solid rgba(59, 130, 246, 0.35);
-}
-.overlay-active-badge .inactive {
-    background: rgba(148, 163, 184, 0.18);
-    color: #94a3b8;
-    border-color: rgba(148, 163, 184, 0.35);
-}
-.overlay-toggle-container {
-    margin: 0.6rem 0 0.2rem;
+.stSlider > div[data-baseweb="slider"] > div {
+    padding-top: 0.5rem;
+    padding-bottom: 1.2rem;
 }
-.overlay-toggle-container > div[data-testid="stVerticalBlock"] {
-    gap: 0.55rem;
+.stCheckbox {
+    margin-bottom: 0.3rem;
 }
-.overlay-toggle-container div[data-testid="stCheckbox"] {
-    background: rgba(37, 99, 235, 0.08);
-    border: 1px solid rgba(56, 189, 248, 0.28);
-    border-radius: 14px;
-    padding: 0.45rem 0.7rem;
-    transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
-}
-.overlay-toggle-container div[data-testid="stCheckbox"][aria-checked="false"] {
-    background: rgba(15, 23, 42, 0.25);
-    border-color: rgba(148, 163, 184, 0.35);
-    opacity: 0.72;
-}
-.overlay-toggle-container div[data-testid="stCheckbox"]:hover {
-    border-color: rgba(96, 165, 250, 0.8);
-    box-shadow: 0 0 0 3px rgba(56, 189, 248, 0.16);
-    background: rgba(37, 99, 235, 0.15);
-}
-.overlay-toggle-container div[data-testid="stCheckbox"] label {
-    color: #e2e8f0;
-    font-weight: 600;
-    letter-spacing: 0.02em;
-}
-.overlay-toggle-container div[data-testid="stCheckbox"] label > div:first-child {
-    margin-right: 0.55rem;
-}
-.overlay-toggle-container div[data-testid="stCheckbox"][aria-checked="true"] {
-    background: rgba(56, 189, 248, 0.2);
-    border-color: rgba(14, 165, 233, 0.55);
-    box-shadow: 0 0 0 3px rgba(56, 189, 248, 0.22);
-}
-.copy-export-row {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 0.65rem;
-    margin-top: 0.6rem;
-}
-.copy-button {
-    padding: 0.5rem 0.85rem;
-    border-radius: 12px;
-    border: 1px solid rgba(56, 189, 248, 0.45);
-    background: rgba(37, 99, 235, 0.18);
-    color: #e0f2fe;
-    font-weight: 600;
-    letter-spacing: 0.03em;
-    cursor: pointer;
-    transition: transform 0.15s ease, box-shadow 0.2s ease, border-color 0.2s ease;
-}
-.copy-button:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 8px 18px rgba(56, 189, 248, 0.18);
-    border-color: rgba(96, 165, 250, 0.8);
-}
-.copy-button:active {
-    transform: translateY(0);
-}
-.toast-stack {
-    position: fixed;
-    top: 1.1rem;
-    right: 1.1rem;
-    display: flex;
-    flex-direction: column;
-    gap: 0.6rem;
-    z-index: 9999;
-}
-.custom-toast {
-    min-width: 260px;
-    max-width: 320px;
-    display: flex;
-    align-items: center;
-    gap: 0.65rem;
-    padding: 0.75rem 0.85rem;
-    border-radius: 12px;
-    box-shadow: 0 16px 35px rgba(15, 23, 42, 0.35);
-    font-size: 0.88rem;
-    font-weight: 600;
-    transition: opacity 0.25s ease, transform 0.3s ease;
-    position: relative;
-    backdrop-filter: blur(8px);
-}
-.custom-toast .toast-icon {
-    font-size: 1rem;
-}
-.custom-toast .toast-message {
-    flex: 1;
-}
-.custom-toast.success {
-    background: rgba(22, 163, 74, 0.22);
-    border: 1px solid rgba(34, 197, 94, 0.45);
-    color: #bbf7d0;
-}
-.custom-toast.error {
-    background: rgba(220, 38, 38, 0.22);
-    border: 1px solid rgba(248, 113, 113, 0.48);
-    color: #fecaca;
-}
-.custom-toast.info {
-    background: rgba(14, 165, 233, 0.22);
-    border: 1px solid rgba(56, 189, 248, 0.48);
-    color: #e0f2fe;
-}
-.custom-toast .toast-close {
-    background: transparent;
-    border: none;
-    color: inherit;
-    font-size: 1rem;
-    cursor: pointer;
-    margin-left: auto;
-    line-height: 1;
-}
-.custom-toast .toast-close:hover {
-    opacity: 0.85;
-}
-.custom-toast.hide {
-    opacity: 0;
-    transform: translateX(16px);
-}
-.sidebar-hamburger {
-    display: none;
-    position: fixed;
-    top: 1rem;
-    left: 1rem;
-    z-index: 1001;
-    background: rgba(15, 23, 42, 0.9);
-    color: #f8fafc;
-    border-radius: 12px;
-    padding: 0.55rem 0.8rem;
-    font-weight: 600;
-    letter-spacing: 0.05em;
-    cursor: pointer;
-    border: 1px solid rgba(148, 163, 184, 0.35);
-    box-shadow: 0 10px 25px rgba(15, 23, 42, 0.35);
-}
-.sidebar-overlay {
-    display: none;
-}
-.sidebar-section-title {
-    margin: 1rem 0 0.5rem;
-    padding: 0.45rem 0.75rem;
-    border-radius: 12px;
-    background: rgba(148, 163, 184, 0.12);
-    color: #e2e8f0;
-    font-size: 0.78rem;
-    font-weight: 600;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-}
-.sidebar-slider-spacer {
-    height: 0.6rem;
-}
-[data-testid="stSidebar"] .stSlider {
-    padding-top: 0.2rem;
-    padding-bottom: 0.15rem;
-}
-[data-testid="stSidebar"] .stSlider > div {
-    padding-right: 0.35rem;
+.stSelectbox > div {
+    margin-bottom: 1.2rem;
 }
-[data-testid="stSidebar"] .stNumberInput {
-    margin-top: 0.1rem;
+.stExpander {
+    border: 1px solid rgba(250, 250, 250, 0.1);
+    border-radius: 8px;
 }
-@media (max-width: 900px) {
-    .sidebar-hamburger {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.45rem;
-    }
-    .sidebar-overlay {
-        display: block;
-        position: fixed;
-        inset: 0;
-        background: rgba(15, 23, 42, 0.45);
-        z-index: 1000;
-        opacity: 0;
-        transition: opacity 0.3s ease;
-        pointer-events: none;
-    }
-    body.sidebar-open .sidebar-overlay {
-        opacity: 1;
-        pointer-events: auto;
-    }
-    [data-testid="stSidebar"] {
-        position: fixed;
-        top: 0;
-        left: 0;
-        height: 100%;
-        width: 78vw;
-        max-width: 320px;
-        transform: translateX(-100%);
-        transition: transform 0.3s ease;
-        z-index: 1002;
-        box-shadow: 8px 0 24px rgba(15, 23, 42, 0.45);
-    }
-    body.sidebar-open [data-testid="stSidebar"] {
-        transform: translateX(0);
-    }
-    .main .block-container {
-        padding-top: 3.25rem;
-    }
-    div[data-testid="column"] {
-        width: 100% !important;
-        flex: 1 1 100% !important;
-    }
+</style>
+"""
+
+SIDEBAR_CSS = """
+<style>
+[data-testid="stSidebar"] {
+    background: linear-gradient(to bottom right, #1D2951, #3A5DFF);
+    color: white;
 }
-[data-testid="stToggle"][aria-checked="false"] {
-    filter: grayscale(0.6);
-    opacity: 0.75;
+[data-testid="stSidebar"] * {
+    color: white !important;
 }
 </style>
 """
-st.markdown("""
-    <style>
-    [data-testid="stSidebar"] {
-        background: linear-gradient(to bottom right, #1D2951, #3A5DFF);
-        color: white;
-    }
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
 
-st.markdown(
+
+# Main stylesheet, served by Streamlit's static file handler (enabled via
+# `enableStaticServing` in .streamlit/config.toml). The browser caches it,
+# so reruns ship zero CSS bytes for this payload; only the small widget and
+# sidebar blocks above stay inline.
+_APP_CSS_PATH = Path(__file__).resolve().parent / "static" / "app.css"
+
+
+@st.cache_resource(show_spinner=False)
+def _inject_static_css() -> None:
     """
-    <div class="sidebar-hamburger" onclick="toggleSidebar()">☰ Menu</div>
-    <div class="sidebar-overlay" onclick="toggleSidebar()"></div>
-    <script>
-    (function() {
-        if (window.sidebarToggleInitialized) return;
-        window.sidebarToggleInitialized = true;
-        window.toggleSidebar = function() {
-            document.body.classList.toggle('sidebar-open');
-        };
-        document.addEventListener('keydown', function(event) {
-            if (event.key === 'Escape') {
-                document.body.classList.remove('sidebar-open');
-            }
-        });
-        window.addEventListener('resize', function() {
-            if (window.innerWidth > 900) {
-                document.body.classList.remove('sidebar-open');
-            }
-        });
-    })();
-    </script>
-    """,
-    unsafe_allow_html=True,
+    Emit the static style blocks and the toast anchor exactly once.
+
+    Caching the calls lets Streamlit replay the rendered elements on every
+    rerun instead of re-shipping the markdown through the delta protocol on
+    each autorefresh tick.
+    """
+    st.markdown(WIDGET_CSS, unsafe_allow_html=True)
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(
+            '<link rel="stylesheet" href="app/static/app.css">',
+            unsafe_allow_html=True,
+        )
+    else:
+        # Static serving is off (e.g. an embedded deployment without the
+        # repo's config.toml) — fall back to inlining the stylesheet.
+        st.markdown(f"<style>\n{_APP_CSS_PATH.read_text()}</style>", unsafe_allow_html=True)
+    st.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
+    st.markdown('<div id="toast-stack" class="toast-stack"></div>', unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _inject_sidebar_chrome() -> None:
+    """
+    Emit the mobile hamburger/overlay markup and its toggle script once.
+
+    st.markdown strips <script> tags, so the toggle logic runs through
+    components.html instead; the component lives in an iframe, hence every
+    reference goes through window.parent. Caching the call replays both
+    elements on reruns rather than re-registering the listeners each tick.
+    """
+    st.markdown(
+        """
+        <div class="sidebar-hamburger" onclick="toggleSidebar()">☰ Menu</div>
+        <div class="sidebar-overlay" onclick="toggleSidebar()"></div>
+        """,
+        unsafe_allow_html=True,
+    )
+    components.html(
+        """
+        <script>
+        (function() {
+            var win = window.parent;
+            if (win.sidebarToggleInitialized) return;
+            win.sidebarToggleInitialized = true;
+            win.toggleSidebar = function() {
+                win.document.body.classList.toggle('sidebar-open');
+            };
+            win.document.addEventListener('keydown', function(event) {
+                if (event.key === 'Escape') {
+                    win.document.body.classList.remove('sidebar-open');
+                }
+            });
+            win.addEventListener('resize', function() {
+                if (win.innerWidth > 900) {
+                    win.document.body.classList.remove('sidebar-open');
+                }
+            });
+        })();
+        </script>
+        """,
+        height=0,
+    )
+
+
+def _card_classes(variant: str, highlight: bool) -> str:
+    classes = ["metric-card"]
+    if variant:
+        classes.extend(part for part in variant.split(" ") if part)
+    if highlight:
+        classes.append("metric-card-flash")
+    return " ".join(classes)
+
+
+# Every (variant, highlight) combination the dashboard produces, resolved
+# once at import so the per-card path is a dict lookup.
+_KNOWN_VARIANTS = (
+    "",
+    "metric-card-signal signal-buy",
+    "metric-card-signal signal-sell",
+    "metric-card-signal signal-hold",
 )
-st.markdown('<div id="toast-stack" class="toast-stack"></div>', unsafe_allow_html=True)
+_CLASS_LOOKUP = {
+    (variant, highlight): _card_classes(variant, highlight)
+    for variant in _KNOWN_VARIANTS
+    for highlight in (False, True)
+}
 
 
 def render_metric_card(
@@ -566,7 +164,8 @@ def render_metric_card(
     badge: str | None = None,
     variant: str | None = None,
     highlight: bool = False,
-) -> None:
+) -> str:
+    """Build the HTML for one metric tile; `render_metric_row` flushes them."""
     delta_html = ""
     if delta is not None:
         threshold = 1e-9
@@ -579,31 +178,47 @@ def render_metric_card(
         else:
             sign_class = "neutral"
             icon = "⏺"
-        delta_text = f"{delta:+.2f}{delta_suffix}"
-        delta_html = f"<span class='metric-delta {sign_class}'>{icon} {delta_text}</span>"
+        delta_html = f"<span class='metric-delta {sign_class}'>{icon} {delta:+.2f}{delta_suffix}</span>"
 
     badge_html = f"<span class='metric-badge'>{badge}</span>" if badge else ""
 
-    classes = ["metric-card"]
-    if variant:
-        classes.extend(part for part in variant.split(" ") if part)
-    if highlight:
-        classes.append("metric-card-flash")
-    class_attr = " ".join(classes)
+    lookup_key = (variant or "", highlight)
+    class_attr = _CLASS_LOOKUP.get(lookup_key) or _card_classes(*lookup_key)
+
+    return (
+        f"<div class=\"{class_attr}\">"
+        f"<div class=\"metric-label\">{label}{badge_html}</div>"
+        f"<div class=\"metric-value\">{value}</div>"
+        f"{delta_html}"
+        "</div>"
+    )
+
+
+def render_metric_row(
+    cards: list[dict[str, Any]],
+    *,
+    widths: tuple[float, ...] | None = None,
+) -> None:
+    """
+    Flush a row of metric cards through one st.markdown call.
 
+    One delta message per row instead of one per card (plus the columns
+    scaffolding the per-card version needed).
+    """
+    columns = (
+        " ".join(f"{width}fr" for width in widths)
+        if widths
+        else f"repeat({len(cards)}, 1fr)"
+    )
+    cards_html = "".join(render_metric_card(**card) for card in cards)
     st.markdown(
-        f"""
-        <div class="{class_attr}">
-            <div class="metric-label">{label}{badge_html}</div>
-            <div class="metric-value">{value}</div>
-            {delta_html}
-        </div>
-        """,
+        f"<div class='metric-row' style='display:grid;grid-template-columns:{columns};"
+        f"gap:1rem;align-items:stretch;'>{cards_html}</div>",
         unsafe_allow_html=True,
     )
 
 
-def sidebar_slider_with_input(
+def sidebar_slider(
     label: str,
     *,
     min_value: float | int,
@@ -615,112 +230,220 @@ def sidebar_slider_with_input(
     format_str: str | None = None,
 ) -> float | int:
     """
-    Render a slider paired with a compact number input for precise adjustments.
-    Synchronises both widgets via the provided key.
+    Render a single session-state-backed sidebar slider.
+
+    One widget per setting keeps the rerun cost low; the previous
+    slider/number-input pair tripled the widget count for no extra
+    functionality since the slider already honours the configured step.
     """
     value_type = float if any(isinstance(v, float) for v in (min_value, max_value, value, step)) else int
     if key not in st.session_state:
         st.session_state[key] = value_type(value)
 
-    current_value = value_type(st.session_state[key])
     slider_kwargs = dict(
         min_value=value_type(min_value),
         max_value=value_type(max_value),
-        value=current_value,
         step=value_type(step),
         help=help_text,
     )
     if format_str:
         slider_kwargs["format"] = format_str
 
-    slider_col, input_col = st.sidebar.columns((5, 1))
-    slider_value = slider_col.slider(label, **slider_kwargs)
-    slider_value = value_type(slider_value)
+    st.sidebar.slider(label, key=key, **slider_kwargs)
+    return value_type(st.session_state[key])
 
-    precision_label = f"{label} precise"
-    number_value = input_col.number_input(
-        precision_label,
-        min_value=value_type(min_value),
-        max_value=value_type(max_value),
-        value=slider_value,
-        step=value_type(step),
-        help=help_text,
-        label_visibility="collapsed",
-    )
-    number_value = value_type(number_value)
-
-    new_value = number_value
-    if st.session_state[key] != new_value:
-        st.session_state[key] = new_value
 
-    st.sidebar.markdown("<div class='sidebar-slider-spacer'></div>", unsafe_allow_html=True)
-    return st.session_state[key]
-
-
-def track_metric_change(key: str, value: Any) -> bool:
-    """
-    Store a normalised snapshot of the metric and return True when the value changes.
-    """
-    if isinstance(value, float):
-        normalized: Any = round(value, 6)
-    elif isinstance(value, (int,)):
-        normalized = value
-    elif value is None:
-        normalized = "None"
-    else:
-        normalized = str(value)
-
-    changed = key in st.session_state and st.session_state[key] != normalized
-    st.session_state[key] = normalized
-    return changed
+# Stateless display constants; nothing here varies between reruns.
+_SIGNAL_VARIANTS = {
+    "BUY": "metric-card-signal signal-buy",
+    "SELL": "metric-card-signal signal-sell",
+    "HOLD": "metric-card-signal signal-hold",
+}
 
+_PREVIEW_COLUMN_ORDER = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "rsi",
+    "macd",
+    "macd_signal",
+    "signal",
+    "signal_strength",
+    "divergence",
+)
 
-def show_toast(message: str, *, variant: str = "info", duration: int = 6) -> None:
-    """Render a dismissible toast in the top-right corner."""
-    toast_id = uuid.uuid4().hex
-    icon_map = {
-        "success": "✅",
-        "error": "❌",
-        "info": "ℹ️",
-    }
-    icon = icon_map.get(variant, "ℹ️")
-    safe_message = (
-        message.replace("\\", "\\\\")
-        .replace("'", "\\'")
-        .replace("\n", "<br>")
-    )
-    toast_script = f"""
-    <script>
-    (function() {{
-        const stack = document.getElementById('toast-stack');
-        if (!stack) {{ return; }}
-        const toast = document.createElement('div');
-        toast.className = 'custom-toast {variant}';
-        toast.id = '{toast_id}';
-        toast.innerHTML = `
-            <span class="toast-icon">{icon}</span>
-            <span class="toast-message">{safe_message}</span>
-            <button class="toast-close" aria-label="Dismiss">×</button>
-        `;
-        toast.querySelector('.toast-close').addEventListener('click', function() {{
+_RECENT_TABLE_COLUMNS = ("close", "rsi", "signal", "signal_strength", "divergence")
+
+_TOAST_ICONS = {
+    "success": "✅",
+    "error": "❌",
+    "info": "ℹ️",
+}
+
+# Single-pass escape table and a template compiled once at import; the
+# flush path only substitutes the spawn() calls.
+_TOAST_ESCAPE = str.maketrans({"\\": "\\\\", "'": "\\'", "\n": "<br>"})
+
+_TOAST_SCRIPT = string.Template("""
+<script>
+(function() {
+    const doc = window.parent.document;
+    const stack = doc.getElementById('toast-stack');
+    if (!stack) { return; }
+    function spawn(id, variant, icon, message, timeoutMs) {
+        if (doc.getElementById(id)) { return; }
+        const toast = doc.createElement('div');
+        toast.className = 'custom-toast ' + variant;
+        toast.id = id;
+        toast.innerHTML = '<span class="toast-icon">' + icon + '</span>'
+            + '<span class="toast-message">' + message + '</span>'
+            + '<button class="toast-close" aria-label="Dismiss">×</button>';
+        toast.querySelector('.toast-close').addEventListener('click', function() {
             toast.classList.add('hide');
             setTimeout(() => toast.remove(), 320);
-        }});
+        });
         stack.appendChild(toast);
-        setTimeout(() => {{
-            if (toast.parentNode) {{
+        setTimeout(() => {
+            if (toast.parentNode) {
                 toast.classList.add('hide');
                 setTimeout(() => toast.remove(), 320);
-            }}
-        }}, {duration * 1000});
-    }})();
-    </script>
+            }
+        }, timeoutMs);
+    }
+    ${calls}
+})();
+</script>
+""")
+
+
+def show_toast(message: str, *, variant: str = "info", duration: int = 6) -> None:
+    """Queue a dismissible toast; the queue is flushed once per rerun."""
+    # The counter lives in session state so ids never repeat across reruns;
+    # a script-scope counter would restart at zero every execution and trip
+    # the duplicate-id guard in the toast script.
+    seq = st.session_state.get("_toast_seq", 0)
+    st.session_state["_toast_seq"] = seq + 1
+    st.session_state.setdefault("_toast_queue", []).append(
+        {
+            "id": f"toast-{seq}",
+            "message": message,
+            "variant": variant,
+            "duration": duration,
+        }
+    )
+
+
+def _flush_toasts() -> None:
     """
-    st.markdown(toast_script, unsafe_allow_html=True)
+    Emit every queued toast through one zero-height component frame.
+
+    Batching keeps the per-toast script tags out of the delta protocol, and
+    clearing the queue stops reruns from resurrecting toasts that were
+    already shown — the old per-call st.markdown scripts re-created their
+    toast on every rerun.
+    """
+    queue = st.session_state.get("_toast_queue")
+    if not queue:
+        return
+    calls = []
+    for toast in queue:
+        icon = _TOAST_ICONS.get(toast["variant"], "ℹ️")
+        safe_message = toast["message"].translate(_TOAST_ESCAPE)
+        calls.append(
+            f"spawn('{toast['id']}', '{toast['variant']}', '{icon}', "
+            f"'{safe_message}', {toast['duration'] * 1000});"
+        )
+    components.html(_TOAST_SCRIPT.substitute(calls=" ".join(calls)), height=0)
+    queue.clear()
+
+
+# Interval choices resolved once at import — label order for the selectbox,
+# the label → data-source code map, and the default index — instead of
+# rebuilding a dict and list and scanning for "4h" on every rerun.
+_INTERVAL_CHOICES = (
+    ("1m", "1m"),
+    ("5m", "5m"),
+    ("15m", "15m"),
+    ("30m", "30m"),
+    ("1h", "1h"),
+    ("4h", "4h"),
+    ("1d", "1d"),
+    ("1W", "1wk"),
+    ("1M", "1mo"),
+    ("1Y", "1y"),
+)
+_INTERVAL_LABELS = tuple(label for label, _ in _INTERVAL_CHOICES)
+_INTERVAL_MAP = dict(_INTERVAL_CHOICES)
+_DEFAULT_INTERVAL_IDX = _INTERVAL_LABELS.index("4h")
+
+# Overlay metadata is immutable per process; building the dicts inside the
+# sidebar block re-allocated ~30 literals on every rerun.
+_LAYER_DEFAULTS = MappingProxyType(
+    {
+        "layer_macd": True,
+        "layer_rsi": True,
+        "layer_signals": False,
+        "layer_bbands": False,
+        "layer_emas": False,
+        "layer_divergence": True,
+        "layer_backtest_trades": False,
+    }
+)
+
+_TOGGLE_ORDER = (
+    "layer_signals",
+    "layer_bbands",
+    "layer_emas",
+    "layer_divergence",
+    "layer_macd",
+    "layer_rsi",
+    "layer_backtest_trades",
+)
+
+_LAYER_DEFINITIONS = MappingProxyType(
+    {
+        "layer_macd": {
+            "label": "📊 MACD Panel",
+            "help": "Plot MACD and signal lines in a dedicated panel to track momentum shifts.",
+            "badge": "MACD",
+        },
+        "layer_rsi": {
+            "label": "📉 RSI Panel",
+            "help": "Display the RSI panel beneath the chart for overbought/oversold confirmation.",
+            "badge": "RSI",
+        },
+        "layer_signals": {
+            "label": "📍 Buy & Sell Markers",
+            "help": "Overlay generated buy/sell markers directly on the price candles.",
+            "badge": "Signals",
+        },
+        "layer_bbands": {
+            "label": "📈 Bollinger Bands",
+            "help": "Add Bollinger Bands around price to visualize volatility envelopes.",
+            "badge": "Bollinger",
+        },
+        "layer_emas": {
+            "label": "📏 EMAs",
+            "help": "Draw fast and slow exponential moving averages to assess trend bias.",
+            "badge": "EMAs",
+        },
+        "layer_divergence": {
+            "label": "🔀 Divergence Markers",
+            "help": "Highlight bullish or bearish divergences detected by the strategy.",
+            "badge": "Divergence",
+        },
+        "layer_backtest_trades": {
+            "label": "🧪 Backtest Trades",
+            "help": "Reveal simulated trade entries and exits when backtesting is enabled.",
+            "badge": "Backtest",
+        },
+    }
+)
 
 
 def render_overlay_controls(
-    layer_meta: dict[str, dict[str, str]],
     *,
     backtest_mode_enabled: bool,
     container: Any = st,
@@ -728,15 +451,6 @@ def render_overlay_controls(
     expanded: bool = False,
 ) -> dict[str, bool]:
     """Render overlay toggles within the provided container and sync them with session state."""
-    toggle_order = [
-        "layer_signals",
-        "layer_bbands",
-        "layer_emas",
-        "layer_divergence",
-        "layer_macd",
-        "layer_rsi",
-        "layer_backtest_trades",
-    ]
     states: dict[str, bool] = {}
 
     expander_ctx = (
@@ -748,11 +462,13 @@ def render_overlay_controls(
     with expander_ctx:
         if expand_label is None:
             container.markdown("**📈 Chart Overlay Options**")
-        container.markdown("<div class='overlay-toggle-container'>", unsafe_allow_html=True)
+        # The old open/close <div> markdowns never wrapped the checkboxes
+        # (each st.markdown is its own element), so they were two dead
+        # deltas per rerun.
         columns_func = getattr(container, "columns", st.columns)
-        toggle_columns = columns_func(2)
-        for idx, key in enumerate(toggle_order):
-            meta = layer_meta[key]
+        toggle_columns = columns_func(2, gap="small")
+        for idx, key in enumerate(_TOGGLE_ORDER):
+            meta = _LAYER_DEFINITIONS[key]
             disabled = key == "layer_backtest_trades" and not backtest_mode_enabled
             current_value = st.session_state.get(key, False)
             widget_value = False if disabled else bool(current_value)
@@ -770,45 +486,27 @@ def render_overlay_controls(
                 )
             if disabled:
                 states[key] = False
-            st.session_state[key] = states[key]
-        container.markdown("</div>", unsafe_allow_html=True)
+    # One batched write instead of a per-toggle assignment in the loop.
+    st.session_state.update(states)
     return states
 
 
-# Internal imports
-from streamlit_autorefresh import st_autorefresh
-try:
-    from signalbot.main import run
-except ModuleNotFoundError as exc:  # pragma: no cover - configuration dependent
-    raise RuntimeError(
-        "Failed to import `signalbot.main`. Make sure the project root is on PYTHONPATH "
-        "or install the package with `pip install -e .`."
-    ) from exc
-from signalbot.backtest import backtest_signals
-from signalbot.plotting import (
-    PLOTLY_AVAILABLE,
-    plot_btc_chart,
-    plot_btc_chart_altair,
-    plot_equity_curve,
-    plot_equity_curve_altair,
-)
+@functools.lru_cache(maxsize=1)
+def _plotting():
+    """
+    Import the plotting module on first chart render.
 
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
-st.markdown(
+    plotly and altair together take the longest of any import in the app;
+    deferring them lets the sidebar and metric sections paint while the
+    chart fragment is still loading its dependencies.
     """
-    <style>
-    [data-testid="stSidebar"] {
-        background: linear-gradient(to bottom right, #1D2951, #3A5DFF);
-        color: white;
-    }
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-st.markdown('<div id="toast-stack" class="toast-stack"></div>', unsafe_allow_html=True)
+    from signalbot import plotting
+
+    return plotting
+
+
+_inject_static_css()
+_inject_sidebar_chrome()
 
 # ==============================
 # ⚙️ Sidebar Controls
@@ -818,90 +516,25 @@ with st.sidebar:
 
     settings_tabs = st.tabs(["Strategy", "Backtest"])
 
-    # Shared overlay metadata
-    layer_defaults = {
-        "layer_macd": True,
-        "layer_rsi": True,
-        "layer_signals": False,
-        "layer_bbands": False,
-        "layer_emas": False,
-        "layer_divergence": True,
-        "layer_backtest_trades": False,
-    }
-    for key, default in layer_defaults.items():
+    for key, default in _LAYER_DEFAULTS.items():
         st.session_state.setdefault(key, default)
 
-    layer_definitions = {
-        "layer_macd": {
-            "label": "📊 MACD Panel",
-            "help": "Plot MACD and signal lines in a dedicated panel to track momentum shifts.",
-            "badge": "MACD",
-        },
-        "layer_rsi": {
-            "label": "📉 RSI Panel",
-            "help": "Display the RSI panel beneath the chart for overbought/oversold confirmation.",
-            "badge": "RSI",
-        },
-        "layer_signals": {
-            "label": "📍 Buy & Sell Markers",
-            "help": "Overlay generated buy/sell markers directly on the price candles.",
-            "badge": "Signals",
-        },
-        "layer_bbands": {
-            "label": "📈 Bollinger Bands",
-            "help": "Add Bollinger Bands around price to visualize volatility envelopes.",
-            "badge": "Bollinger",
-        },
-        "layer_emas": {
-            "label": "📏 EMAs",
-            "help": "Draw fast and slow exponential moving averages to assess trend bias.",
-            "badge": "EMAs",
-        },
-        "layer_divergence": {
-            "label": "🔀 Divergence Markers",
-            "help": "Highlight bullish or bearish divergences detected by the strategy.",
-            "badge": "Divergence",
-        },
-        "layer_backtest_trades": {
-            "label": "🧪 Backtest Trades",
-            "help": "Reveal simulated trade entries and exits when backtesting is enabled.",
-            "badge": "Backtest",
-        },
-    }
-
     # Strategy Settings Tab
     with settings_tabs[0]:
         st.subheader("📊 Strategy Settings")
-        interval_options = {
-            "1m": "1m",
-            "5m": "5m",
-            "15m": "15m",
-            "30m": "30m",
-            "1h": "1h",
-            "4h": "4h",
-            "1d": "1d",
-            "1W": "1wk",
-            "1M": "1mo",
-            "1Y": "1y",
-        }
-        interval_labels = list(interval_options.keys())
-        st.session_state.setdefault("interval_select", "4h")
-        default_label = st.session_state.get("interval_select", "4h")
-        if default_label not in interval_labels:
-            default_label = "4h"
-            st.session_state["interval_select"] = default_label
-        default_interval_index = interval_labels.index(default_label)
+        st.session_state.setdefault("interval_select", _INTERVAL_LABELS[_DEFAULT_INTERVAL_IDX])
+        if st.session_state["interval_select"] not in _INTERVAL_MAP:
+            st.session_state["interval_select"] = _INTERVAL_LABELS[_DEFAULT_INTERVAL_IDX]
         selected_interval_label = st.selectbox(
             "Chart Interval",
-            interval_labels,
-            index=default_interval_index,
+            _INTERVAL_LABELS,
+            index=_DEFAULT_INTERVAL_IDX,
             key="interval_select",
             help="Controls the BTC timeframe used for the strategy and displayed chart.",
         )
-        interval = interval_options[selected_interval_label]
+        interval = _INTERVAL_MAP[selected_interval_label]
 
         overlay_states_sidebar = render_overlay_controls(
-            layer_definitions,
             backtest_mode_enabled=st.session_state.get("toggle_backtest_mode", False),
             container=st,
             expand_label=None,
@@ -909,7 +542,7 @@ with st.sidebar:
 
         st.divider()
         st.subheader("🎯 RSI Settings")
-        period = sidebar_slider_with_input(
+        period = sidebar_slider(
             "RSI Period",
             min_value=5,
             max_value=50,
@@ -918,7 +551,7 @@ with st.sidebar:
             key="setting_rsi_period",
             help_text="Number of periods used to calculate RSI. Lower values react faster but are noisier.",
         )
-        oversold = sidebar_slider_with_input(
+        oversold = sidebar_slider(
             "Oversold Threshold",
             min_value=10,
             max_value=50,
@@ -927,7 +560,7 @@ with st.sidebar:
             key="setting_oversold",
             help_text="RSI level considered oversold. Signals below this threshold may highlight potential entries.",
         )
-        overbought = sidebar_slider_with_input(
+        overbought = sidebar_slider(
             "Overbought Threshold",
             min_value=50,
             max_value=90,
@@ -938,7 +571,7 @@ with st.sidebar:
         )
 
         st.subheader("⏱️ Other Settings")
-        lookback_days = sidebar_slider_with_input(
+        lookback_days = sidebar_slider(
             "Lookback Window (days)",
             min_value=30,
             max_value=1825,
@@ -949,7 +582,7 @@ with st.sidebar:
         )
         refresh_rate = None
         if selected_interval_label == "1M":
-            refresh_rate = sidebar_slider_with_input(
+            refresh_rate = sidebar_slider(
                 "Auto-refresh (seconds)",
                 min_value=1,
                 max_value=300,
@@ -982,27 +615,16 @@ with st.sidebar:
 if "backtest_mode" not in locals():
     backtest_mode = st.session_state.get("toggle_backtest_mode", False)
 
-# Ensure overlay states reflect most recent sidebar selections
-if "overlay_states_sidebar" in locals():
-    for key, value in overlay_states_sidebar.items():
-        st.session_state[key] = value
-
 
 
-# ==============================
-# 🔁 Auto-refresh (only chart)
-# ==============================
-if refresh_rate is not None:
-    st_autorefresh(interval=refresh_rate * 1000, key="autorefresh")
-
 # ==============================
 # 💾 Session State
 # ==============================
 if "df" not in st.session_state:
     st.session_state["df"] = None
 
-if "params" not in st.session_state:
-    st.session_state["params"] = {}
+if "_params_key" not in st.session_state:
+    st.session_state["_params_key"] = None
 
 st.markdown(
     """
@@ -1024,28 +646,93 @@ else:
         f"Viewing the {selected_interval_label} interval. Manual refresh applies; overlays can be switched on or off via the sidebar."
     )
 
-if not PLOTLY_AVAILABLE:
-    st.info(
-        "Plotly is not installed in this environment. Falling back to a simplified Altair chart; "
-        "install `plotly` for the full interactive experience."
+run_button = st.button("🚀 Run Strategy", type="primary")
+
+
+# Imported here rather than at the top so the sidebar and hero are already
+# streaming to the browser while pandas-heavy pipeline modules load.
+try:
+    from signalbot.data import get_btc_ohlc
+    from signalbot.main import run
+except ModuleNotFoundError as exc:  # pragma: no cover - configuration dependent
+    raise RuntimeError(
+        "Failed to import `signalbot.main`. Make sure the project root is on PYTHONPATH "
+        "or install the package with `pip install -e .`."
+    ) from exc
+
+# Candles go stale far slower than indicator parameters change, so the
+# download layer persists to disk (surviving app restarts) while the
+# signal layer stays in memory keyed on a candle fingerprint.
+_FETCH_TTL = refresh_rate * 12 if refresh_rate else 3600
+
+
+def _df_key(frame: pd.DataFrame) -> tuple:
+    """
+    O(1) fingerprint for a candle frame: row count, last timestamp, and
+    last close. Candle windows only ever grow or shift, so the endpoints
+    identify a frame without walking every row the way hashing the whole
+    DataFrame would; every frame-keyed cache below uses this as its key.
+    """
+    return (len(frame), int(frame.index[-1].value), float(frame["close"].iat[-1]))
+
+
+@st.cache_data(persist="disk", ttl=_FETCH_TTL, show_spinner=False, max_entries=8)
+def _fetch_candles(interval: str, lookback_days: int) -> pd.DataFrame:
+    return get_btc_ohlc(interval=interval, lookback_days=lookback_days)
+
+
+@st.cache_data(ttl=refresh_rate, show_spinner=False, max_entries=16)
+def _compute_signals(
+    candles_key: tuple,
+    _candles: pd.DataFrame,
+    interval: str,
+    period: int,
+    oversold: int,
+    overbought: int,
+) -> pd.DataFrame:
+    return run(
+        interval=interval,
+        period=period,
+        oversold=oversold,
+        overbought=overbought,
+        ohlc=_candles,
     )
 
-run_button = st.button("🚀 Run Strategy", type="primary")
 
-current_params = {
-    "interval": interval,
-    "interval_label": selected_interval_label,
-    "period": period,
-    "oversold": oversold,
-    "overbought": overbought,
-    "lookback_days": lookback_days,
-}
+def _cached_run(
+    interval: str,
+    period: int,
+    oversold: int,
+    overbought: int,
+    lookback_days: int,
+) -> pd.DataFrame:
+    """
+    Two-layer cached pipeline: fetch candles, then compute signals.
+
+    Threshold/period tweaks only invalidate the compute layer — the
+    fingerprint of the cached candles keys it, so identical candles with
+    new parameters skip the network entirely.
+    """
+    candles = _fetch_candles(interval, lookback_days)
+    return _compute_signals(_df_key(candles), candles, interval, period, oversold, overbought)
+
+
+# A single hashed tuple stands in for the old parameter dict: one int
+# comparison per rerun instead of rebuilding and diffing six dict entries.
+params_key = hash(
+    (interval, selected_interval_label, period, oversold, overbought, lookback_days)
+)
 
 should_fetch = run_button or st.session_state["df"] is None
 
-if st.session_state["params"] != current_params:
+if run_button:
+    # Explicit rerun requests bypass both cache layers.
+    _fetch_candles.clear()
+    _compute_signals.clear()
+
+if st.session_state["_params_key"] != params_key:
     should_fetch = True
-    st.session_state["params"] = current_params
+    st.session_state["_params_key"] = params_key
 
 # ==============================
 # 📡 Fetch & Run Strategy
@@ -1054,7 +741,7 @@ just_ran = False
 if should_fetch:
     with st.spinner("🔄 Fetching BTC data and running strategy..."):
         try:
-            df = run(
+            df = _cached_run(
                 interval=interval,
                 period=period,
                 oversold=oversold,
@@ -1062,13 +749,17 @@ if should_fetch:
                 lookback_days=lookback_days,
             )
             st.session_state["df"] = df
-            st.session_state["last_run_time"] = pd.Timestamp.utcnow().isoformat()
+            # Stored as a ready-to-format UTC Timestamp; the snapshot
+            # fragment reads it back every tick, so parsing there would
+            # repeat on each rerun.
+            st.session_state["last_run_time"] = pd.Timestamp.now(tz="UTC")
             just_ran = True
         except Exception as exc:
             error_message = f"Error while running strategy: {exc}"
             st.error(f"❌ {error_message}")
             show_toast(error_message, variant="error", duration=8)
             st.code(traceback.format_exc(), language="python")
+            _flush_toasts()
             st.stop()
 
 df = st.session_state["df"]
@@ -1076,171 +767,247 @@ df = st.session_state["df"]
 if df is None or df.empty:
     show_toast("No data returned for the selected configuration. Adjust the interval or lookback and try again.", variant="error")
     st.info("Adjust settings and press **Run Strategy** to fetch data.")
+    _flush_toasts()
     st.stop()
 
 data_source = df.attrs.get("data_source", "unknown")
 data_error = df.attrs.get("data_error")
+# Only announce the data source when it actually changes; reruns that
+# reuse the cached frame keep the banner but skip the toast and the
+# error-detail caption.
+source_changed = st.session_state.get("_last_data_source") != data_source
+st.session_state["_last_data_source"] = data_source
 if data_source == "synthetic":
     synthetic_note = (
         "Using synthetic BTC data because live data could not be downloaded. "
         "Reconnect to the internet and ensure `pycoingecko` is installed for real market data."
     )
     st.warning(synthetic_note)
-    if just_ran:
+    if just_ran or source_changed:
         show_toast("Running with synthetic BTC candles (offline mode).", variant="info", duration=7)
-    if data_error:
-        st.caption(f"Data fetch error details: `{data_error}`")
+        if data_error:
+            st.caption(f"Data fetch error details: `{data_error}`")
+
+def _live_df() -> pd.DataFrame:
+    """
+    Working frame for the live fragments.
+
+    On scheduled fragment reruns the cache TTL has usually expired, so this
+    refetches through `_cached_run` and shares the result with the rest of
+    the page via session state; fetch failures fall back to the stale frame.
+    """
+    if refresh_rate is None:
+        return st.session_state["df"]
+    try:
+        fresh = _cached_run(
+            interval=interval,
+            period=period,
+            oversold=oversold,
+            overbought=overbought,
+            lookback_days=lookback_days,
+        )
+    except Exception:
+        return st.session_state["df"]
+    st.session_state["df"] = fresh
+    return fresh
+
 
 # ==============================
 # 🧩 Latest Signal Snapshot
 # ==============================
-last = df.iloc[-1]
 if just_ran:
     show_toast("Strategy executed successfully.", variant="success")
 
-st.markdown("<div class='metric-section-title'>📈 Current Metrics</div>", unsafe_allow_html=True)
 
-last_run_iso = st.session_state.get("last_run_time")
-if last_run_iso:
-    last_run_ts = pd.Timestamp(last_run_iso)
-    if last_run_ts.tzinfo is None:
-        last_run_ts = last_run_ts.tz_localize("UTC")
-    else:
-        last_run_ts = last_run_ts.tz_convert("UTC")
-    st.caption(f"Last run: {last_run_ts.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-
-previous_row = df.iloc[-2] if len(df) >= 2 else None
-price_delta = None
-if previous_row is not None:
-    prev_close = previous_row.get("close", 0)
-    if prev_close not in (0, None):
-        price_delta = (last["close"] / prev_close - 1) * 100
-
-rsi_delta = None
-if "rsi" in df.columns and previous_row is not None:
-    current_rsi = last.get("rsi")
-    previous_rsi = previous_row.get("rsi")
-    if pd.notna(current_rsi) and pd.notna(previous_rsi):
-        rsi_delta = current_rsi - previous_rsi
-
-signal_text = last.get("signal", "HOLD")
-signal_strength = (last.get("signal_strength", "N/A") or "N/A").replace("_", " ").title()
-divergence_text = (last.get("divergence", "None") or "None").title()
-
-price_changed = track_metric_change("metric_close_price", float(last["close"]))
-rsi_value = last.get("rsi")
-rsi_changed = track_metric_change(
-    "metric_rsi",
-    float(rsi_value) if pd.notna(rsi_value) else None,
-)
-signal_state = (signal_text or "HOLD").strip().upper()
-signal_changed = track_metric_change("metric_signal", f"{signal_state}|{signal_strength}")
-signal_display = signal_state.replace("_", " ") if signal_state else "HOLD"
-signal_variant_map = {
-    "BUY": "metric-card-signal signal-buy",
-    "SELL": "metric-card-signal signal-sell",
-    "HOLD": "metric-card-signal signal-hold",
-}
-signal_variant = signal_variant_map.get(signal_state, "metric-card-signal signal-hold")
-
-metrics_cols = st.columns((1.6, 1.6, 2.2))
-with metrics_cols[0]:
-    render_metric_card(
-        "Close Price",
-        f"${last['close']:,.2f}",
-        delta=price_delta,
-        delta_suffix="%",
-        highlight=price_changed,
+@st.fragment(run_every=refresh_rate)
+def _render_signal_snapshot() -> None:
+    df = _live_df()
+    last = df.iloc[-1]
+
+    st.markdown("<div class='metric-section-title'>📈 Current Metrics</div>", unsafe_allow_html=True)
+
+    last_run_ts = st.session_state.get("last_run_time")
+    if last_run_ts is not None:
+        st.caption(f"Last run: {last_run_ts.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+
+    # Read the last two closes/RSI values straight off the ndarrays; the
+    # old per-scalar Series.get() calls each paid pandas __getitem__
+    # dispatch, which adds up at autorefresh cadence.
+    close_arr = df["close"].to_numpy()
+    rsi_arr = df["rsi"].to_numpy() if "rsi" in df.columns else None
+
+    price_delta = None
+    if close_arr.shape[0] >= 2 and close_arr[-2]:
+        price_delta = (close_arr[-1] / close_arr[-2] - 1) * 100
+
+    rsi_delta = None
+    if rsi_arr is not None and rsi_arr.shape[0] >= 2:
+        if not (math.isnan(rsi_arr[-1]) or math.isnan(rsi_arr[-2])):
+            rsi_delta = rsi_arr[-1] - rsi_arr[-2]
+
+    signal_text = last.get("signal", "HOLD")
+    strength_value = last.get("signal_strength", "N/A")
+    signal_strength = (str(strength_value) if pd.notna(strength_value) else "N/A").replace("_", " ").title()
+    divergence_value = last.get("divergence")
+    divergence_text = str(divergence_value).title() if pd.notna(divergence_value) else "None"
+
+    rsi_value = rsi_arr[-1] if rsi_arr is not None and rsi_arr.shape[0] else None
+    signal_state = (signal_text or "HOLD").strip().upper()
+
+    # The signal columns are categoricals, so their int8 codes identify
+    # the (signal, strength) pair without formatting a throwaway string
+    # every tick; non-categorical frames fall back to hashing the labels.
+    try:
+        signal_code = int(df["signal"].cat.codes.iat[-1]) * 16 + int(
+            df["signal_strength"].cat.codes.iat[-1]
+        )
+    except (KeyError, AttributeError):
+        signal_code = hash((signal_state, signal_strength))
+
+    # One tuple compare against the previous snapshot replaces three
+    # separate session-state lookups and stores per rerun.
+    current_metrics = (
+        round(float(close_arr[-1]), 6),
+        round(float(rsi_value), 6)
+        if rsi_value is not None and not math.isnan(rsi_value)
+        else None,
+        signal_code,
     )
-with metrics_cols[1]:
+    prev_metrics = st.session_state.get("_metric_prev")
+    st.session_state["_metric_prev"] = current_metrics
+    if prev_metrics is None:
+        price_changed = rsi_changed = signal_changed = False
+    else:
+        price_changed, rsi_changed, signal_changed = (
+            prev_metrics[i] != current_metrics[i] for i in range(3)
+        )
+    signal_display = signal_state.replace("_", " ") if signal_state else "HOLD"
+    signal_variant = _SIGNAL_VARIANTS.get(signal_state, "metric-card-signal signal-hold")
+
     rsi_display = f"{rsi_value:.2f}" if pd.notna(rsi_value) else "–"
-    render_metric_card(
-        f"RSI ({period})",
-        rsi_display,
-        delta=rsi_delta,
-        highlight=rsi_changed,
-    )
-with metrics_cols[2]:
     badge_value = None if signal_strength.upper() == "N/A" else signal_strength
-    render_metric_card(
-        "Signal",
-        signal_display,
-        badge=badge_value,
-        variant=signal_variant,
-        highlight=signal_changed,
+    render_metric_row(
+        [
+            dict(
+                label="Close Price",
+                value=f"${close_arr[-1]:,.2f}",
+                delta=price_delta,
+                delta_suffix="%",
+                highlight=price_changed,
+            ),
+            dict(
+                label=f"RSI ({period})",
+                value=rsi_display,
+                delta=rsi_delta,
+                highlight=rsi_changed,
+            ),
+            dict(
+                label="Signal",
+                value=signal_display,
+                badge=badge_value,
+                variant=signal_variant,
+                highlight=signal_changed,
+            ),
+        ],
+        widths=(1.6, 1.6, 2.2),
     )
 
-st.caption(f"Divergence flag: **{divergence_text}** · Signal strength reflects EMA trend alignment.")
+    st.caption(f"Divergence flag: **{divergence_text}** · Signal strength reflects EMA trend alignment.")
 
+
+_render_signal_snapshot()
+
+# One setdefault per layer both reads the state and seeds missing keys;
+# the old follow-up block wrote each value straight back into
+# session_state, seven redundant stores per rerun.
 overlay_states = {
-    key: st.session_state.get(key, layer_defaults.get(key, False))
-    for key in layer_definitions
+    key: st.session_state.setdefault(key, _LAYER_DEFAULTS.get(key, False))
+    for key in _TOGGLE_ORDER
 }
 
-show_signals = overlay_states.get("layer_signals", False)
-show_bbands = overlay_states.get("layer_bbands", False)
-show_emas = overlay_states.get("layer_emas", False)
-show_divergence = overlay_states.get("layer_divergence", False)
-show_macd = overlay_states.get("layer_macd", False)
-show_rsi = overlay_states.get("layer_rsi", False)
-show_backtest_trades = overlay_states.get("layer_backtest_trades", False)
-
-st.session_state["layer_signals"] = show_signals
-st.session_state["layer_bbands"] = show_bbands
-st.session_state["layer_emas"] = show_emas
-st.session_state["layer_divergence"] = show_divergence
-st.session_state["layer_macd"] = show_macd
-st.session_state["layer_rsi"] = show_rsi
-st.session_state["layer_backtest_trades"] = show_backtest_trades
+(
+    show_signals,
+    show_bbands,
+    show_emas,
+    show_divergence,
+    show_macd,
+    show_rsi,
+    show_backtest_trades,
+) = (overlay_states[key] for key in _TOGGLE_ORDER)
 
 active_overlay_labels = [
-    layer_definitions[key].get("badge", layer_definitions[key]["label"])
+    _LAYER_DEFINITIONS[key].get("badge", _LAYER_DEFINITIONS[key]["label"])
     for key, enabled in overlay_states.items()
     if enabled and key != "layer_backtest_trades"
 ]
 if show_backtest_trades:
     active_overlay_labels.append(
-        layer_definitions["layer_backtest_trades"].get("badge", layer_definitions["layer_backtest_trades"]["label"])
+        _LAYER_DEFINITIONS["layer_backtest_trades"].get("badge", _LAYER_DEFINITIONS["layer_backtest_trades"]["label"])
     )
 
-indicator_items = [
-    ("MACD", show_macd, "🧮"),
-    ("RSI", show_rsi, "📐"),
-    ("Signals", show_signals, "🎯"),
-    ("Bollinger", show_bbands, "📊"),
-    ("EMAs", show_emas, "📈"),
-    ("Divergence", show_divergence, "🔀"),
-]
-if backtest_mode:
-    indicator_items.append(("Backtest Trades", show_backtest_trades, "💼"))
+# Chip names and icons never change, so the row is pre-rendered as a
+# %-template with one class placeholder per chip; a rerun only fills in
+# chip-on/chip-off instead of re-assembling every span.
+_CHIP_ITEMS = (
+    ("MACD", "🧮"),
+    ("RSI", "📐"),
+    ("Signals", "🎯"),
+    ("Bollinger", "📊"),
+    ("EMAs", "📈"),
+    ("Divergence", "🔀"),
+    ("Backtest Trades", "💼"),
+)
+
 
-chips_html = "".join(
-    f"<span class='chip {'chip-on' if enabled else 'chip-off'}'>{icon}<strong>{name}</strong></span>"
-    for name, enabled, icon in indicator_items
+def _chip_row_template(count: int) -> str:
+    return (
+        "<div class='chip-row'>"
+        + "".join(
+            "<span class='chip %s'>" + icon + "<strong>" + name + "</strong></span>"
+            for name, icon in _CHIP_ITEMS[:count]
+        )
+        + "</div>"
+    )
+
+
+_CHIP_ROW_BASE = _chip_row_template(6)
+_CHIP_ROW_WITH_BACKTEST = _chip_row_template(7)
+
+chip_flags = (show_macd, show_rsi, show_signals, show_bbands, show_emas, show_divergence)
+chip_template = _CHIP_ROW_BASE
+if backtest_mode:
+    chip_flags += (show_backtest_trades,)
+    chip_template = _CHIP_ROW_WITH_BACKTEST
+st.markdown(
+    chip_template % tuple("chip-on" if enabled else "chip-off" for enabled in chip_flags),
+    unsafe_allow_html=True,
 )
-if chips_html:
-    st.markdown("<div class='chip-row'>" + chips_html + "</div>", unsafe_allow_html=True)
 
 st.markdown("<div class='data-output-title'>📁 Data Output</div>", unsafe_allow_html=True)
-preview_columns = [
-    col
-    for col in [
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "rsi",
-        "macd",
-        "macd_signal",
-        "signal",
-        "signal_strength",
-        "divergence",
-    ]
-    if col in df.columns
-]
+preview_columns = [col for col in _PREVIEW_COLUMN_ORDER if col in df.columns]
 preview_df = df.head(8)[preview_columns] if preview_columns else df.head(8)
-rounded_preview = preview_df.round(3)
+
+_TABLE_STYLES = [
+    {
+        "selector": "thead th",
+        "props": [
+            ("position", "sticky"),
+            ("top", "0"),
+            ("background-color", "#0f172a"),
+            ("color", "#e2e8f0"),
+            ("box-shadow", "0 2px 6px rgba(15, 23, 42, 0.55)"),
+            ("z-index", "3"),
+        ],
+    },
+    {
+        "selector": "tbody td",
+        "props": [("border", "none"), ("font-size", "0.88rem")],
+    },
+    {
+        "selector": "tbody tr:hover",
+        "props": [("background-color", "rgba(56, 189, 248, 0.18)")],
+    },
+]
 
 
 def _style_signal_cell(value: Any) -> str:
@@ -1281,77 +1048,134 @@ def _highlight_macd_cell(value: Any) -> str:
     return "background-color: #fff3cd; color: #856404;" if numeric >= 100 else ""
 
 
-styled_preview = (
-    rounded_preview.style.format(precision=3)
-    .applymap(
-        _style_signal_cell,
-        subset=[col for col in ["signal", "signal_strength"] if col in rounded_preview.columns],
-    )
-    .applymap(
-        _style_rsi_cell,
-        subset=[col for col in ["rsi"] if col in rounded_preview.columns],
-    )
-    .applymap(
-        _highlight_macd_cell,
-        subset=[col for col in ["macd"] if col in rounded_preview.columns],
-    )
-    .set_table_styles(
-        [
-            {
-                "selector": "thead th",
-                "props": [
-                    ("position", "sticky"),
-                    ("top", "0"),
-                    ("background-color", "#0f172a"),
-                    ("color", "#e2e8f0"),
-                    ("box-shadow", "0 2px 6px rgba(15, 23, 42, 0.55)"),
-                    ("z-index", "3"),
-                ],
-            },
-            {
-                "selector": "tbody td",
-                "props": [("border", "none"), ("font-size", "0.88rem")],
-            },
-            {
-                "selector": "tbody tr:hover",
-                "props": [("background-color", "rgba(56, 189, 248, 0.18)")],
-            },
-        ]
+# Rounding, Styler evaluation, and the TSV dump all derive from the same
+# 8-row slice, so they are produced together in one cached call keyed on
+# the frame fingerprint plus the RSI thresholds the cell styles depend
+# on; reruns re-emit the finished strings instead of rebuilding the
+# Styler and re-rounding. Rendering through markdown also makes the
+# sticky-header table styles apply — st.dataframe ignored
+# set_table_styles entirely.
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_preview(preview_key: tuple, _preview: pd.DataFrame) -> tuple[str, str]:
+    rounded = _preview.round(3)
+    styler = (
+        rounded.style.format(precision=3)
+        .map(
+            _style_signal_cell,
+            subset=[col for col in ["signal", "signal_strength"] if col in _preview.columns],
+        )
+        .map(
+            _style_rsi_cell,
+            subset=[col for col in ["rsi"] if col in _preview.columns],
+        )
+        .map(
+            _highlight_macd_cell,
+            subset=[col for col in ["macd"] if col in _preview.columns],
+        )
+        .set_table_styles(_TABLE_STYLES)
     )
-)
+    if "volume" in _preview.columns:
+        styler = styler.format(subset=["volume"], formatter="{:,.0f}")
+    return styler.to_html(), rounded.to_csv(sep="\t", index=True)
+
+
+preview_key = (*_df_key(df), period, oversold, overbought, tuple(preview_columns))
+preview_html, tsv_preview = _build_preview(preview_key, preview_df)
 
-column_config = {
-    "volume": st.column_config.NumberColumn("Volume", width="medium", format="%0.0f"),
-}
 st.subheader("📊 Signal Output Table")
 st.markdown("Download your trade signals or preview them below.")
 with st.expander("📈 View styled table", expanded=True):
-    st.dataframe(
-        styled_preview,
-        use_container_width=True,
-        height=260,
-        column_config=column_config,
+    st.markdown(
+        "<div style='max-height: 260px; overflow: auto;'>" + preview_html + "</div>",
+        unsafe_allow_html=True,
     )
 
-csv_bytes = df.to_csv(index=True).encode("utf-8")
-excel_bytes: bytes | None = None
-excel_engine_used: str | None = None
-excel_error: str | None = None
-st.markdown("### 📤 Export Options")
-for engine in ("xlsxwriter", "openpyxl"):
+# Serialization is deferred until a download button is actually clicked
+# (download_button accepts a zero-arg callable) and then cached on a
+# lightweight fingerprint (row count, last timestamp, tail-of-close hash)
+# passed as the key argument; the frame itself is underscore-prefixed so
+# Streamlit never walks it. Reruns pay nothing for the export path, and a
+# repeated click on an unchanged frame reuses the cached payload.
+
+
+@st.cache_resource(show_spinner=False)
+def _excel_engine() -> str | None:
+    """Resolve the available XLSX engine once per process."""
+    for engine in ("openpyxl", "xlsxwriter"):
+        try:
+            __import__(engine)
+            return engine
+        except ImportError:
+            continue
+    return None
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_csv(df_key: tuple, _df: pd.DataFrame) -> bytes:
+    # pyarrow streams the CSV straight into the buffer (~4x faster here
+    # than to_csv, which builds one giant str and then encodes it —
+    # two full copies of the payload). pyarrow ships with streamlit, but
+    # the pandas writer remains as the safety net.
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return _df.to_csv(index=True).encode("utf-8")
+    buffer = io.BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(_df.reset_index()), buffer)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_excel(df_key: tuple, _df: pd.DataFrame) -> bytes:
+    # Streaming rows into a write-only openpyxl workbook skips pandas'
+    # per-cell styling path in to_excel — several times faster on large
+    # frames and rows are flushed instead of held as cell objects.
+    # xlsxwriter via to_excel stays as the fallback engine.
+    # Excel has no timezone support; both engines reject tz-aware
+    # datetimes, so drop the UTC tzinfo (keeping the wall time) up front.
+    if getattr(_df.index, "tz", None) is not None:
+        _df = _df.tz_localize(None)
     buffer = io.BytesIO()
+    if _excel_engine() == "openpyxl":
+        import openpyxl
+
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("BTC Signals")
+        sheet.append([_df.index.name or "index", *_df.columns])
+        for row in _df.itertuples(index=True, name=None):
+            sheet.append(row)
+        workbook.save(buffer)
+    else:
+        with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+            _df.to_excel(writer, sheet_name="BTC Signals", index=True)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_json(df_key: tuple, _df: pd.DataFrame) -> bytes | str:
+    # orjson encodes several times faster than pandas' JSON writer and
+    # works straight off numpy scalars, skipping the reset_index() copy;
+    # without it the pandas path still serves the download.
     try:
-        with pd.ExcelWriter(buffer, engine=engine) as writer:
-            df.to_excel(writer, sheet_name="BTC Signals", index=True)
-        excel_bytes = buffer.getvalue()
-        excel_engine_used = engine
-        break
-    except (ImportError, ValueError) as exc:
-        excel_error = str(exc)
-        continue
-
-json_records = df.reset_index().to_json(orient="records", date_format="iso")
-tsv_preview = rounded_preview.to_csv(sep="\t", index=True)
+        import orjson
+    except ImportError:
+        return _df.reset_index().to_json(orient="records", date_format="iso")
+    index_name = _df.index.name or "index"
+    columns = list(_df.columns)
+    records = [
+        {index_name: idx.isoformat(), **dict(zip(columns, row))}
+        for idx, row in zip(_df.index, _df.to_numpy().tolist())
+    ]
+    return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+export_key = (*_df_key(df), period, oversold, overbought)
+excel_engine_available = _excel_engine()
+
+st.markdown("### 📤 Export Options")
 tsv_preview_snippet = "\n".join(tsv_preview.splitlines()[:10])
 tsv_bytes = tsv_preview.encode("utf-8")
 
@@ -1359,7 +1183,7 @@ button_cols = st.columns([1, 1, 1, 1])
 with button_cols[0]:
     st.download_button(
         label="⬇️ Download Full Dataset (.CSV)",
-        data=csv_bytes,
+        data=lambda: _build_csv(export_key, df),
         file_name=f"btc_signals_{selected_interval_label.lower()}.csv",
         mime="text/csv",
         use_container_width=True,
@@ -1367,25 +1191,23 @@ with button_cols[0]:
     )
 with button_cols[1]:
     excel_help = (
-        f"Download the dataset as an Excel workbook (engine: {excel_engine_used})."
-        if excel_bytes is not None
+        f"Download the dataset as an Excel workbook (engine: {excel_engine_available})."
+        if excel_engine_available
         else "Excel export unavailable — install `xlsxwriter` or `openpyxl` to enable this download."
     )
     st.download_button(
         label="📊 Export to Excel (.XLSX)",
-        data=excel_bytes or b"",
+        data=(lambda: _build_excel(export_key, df)) if excel_engine_available else b"",
         file_name=f"btc_signals_{selected_interval_label.lower()}.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         use_container_width=True,
         help=excel_help,
-        disabled=excel_bytes is None,
+        disabled=excel_engine_available is None,
     )
-    if excel_bytes is None and excel_error:
-        st.caption(f"Excel export disabled: `{excel_error}`")
 with button_cols[2]:
     st.download_button(
         label="🧾 Export JSON",
-        data=json_records,
+        data=lambda: _build_json(export_key, df),
         file_name=f"btc_signals_{selected_interval_label.lower()}.json",
         mime="application/json",
         use_container_width=True,
@@ -1405,28 +1227,104 @@ st.subheader("📋 Raw TSV Output")
 with st.expander("📋 TSV Preview", expanded=False):
     st.code(tsv_preview_snippet, language="text")
 
+@st.cache_data(show_spinner="Backtesting…", max_entries=4)
+def _cached_backtest(df_key: tuple, _df: pd.DataFrame):
+    from signalbot.backtest import backtest_signals
+
+    return backtest_signals(_df)
+
+
 metrics = None
 trades_df = None
 equity_curve = None
 if backtest_mode:
-    metrics, trades_df, equity_curve = backtest_signals(df)
+    # The frame fingerprint alone is not enough here: RSI thresholds and
+    # period change the signal columns without touching the close tail,
+    # so they join the key.
+    backtest_key = export_key
+    metrics, trades_df, equity_curve = _cached_backtest(backtest_key, df)
 
 trades_for_chart = (
     trades_df if show_backtest_trades and trades_df is not None and not trades_df.empty else None
 )
 
+# Backtest-tab copy: the static markup lives in shared templates and the
+# hot path only fills in the numeric fields.
+_BACKTEST_SUMMARY_TMPL = """
+<div class="backtest-summary">
+    <h3>Backtest Overview</h3>
+    <p>Starting from <strong>${initial_balance:,.2f}</strong>, the strategy finished with <strong>${final_balance:,.2f}</strong> ({net_return:+.2f}%) over the last {lookback_days} days on the {interval_label} chart. It captured {win_rate:.1f}% of {total_trades} simulated trades with a peak drawdown of {max_drawdown:.2f}%.</p>
+    <div class="chip-row" style="margin:0;gap:0.5rem;">
+        <span class="summary-chip {net_class}">Net return {net_return:+.2f}%</span>
+        <span class="summary-chip {win_class}">Win rate {win_rate:.1f}%</span>
+        <span class="summary-chip {dd_class}">Max drawdown {max_drawdown:.2f}%</span>
+    </div>
+</div>
+"""
+
+_BACKTEST_STEPS_TMPL = """
+<div class="backtest-steps">
+    <div class="step-card">
+        <h4>1. Gather price & indicators</h4>
+        <p>Pulls {lookback_days} days of {interval_label} candles and computes EMA, RSI, MACD, and Bollinger overlays.</p>
+    </div>
+    <div class="step-card">
+        <h4>2. Simulate the strategy</h4>
+        <p>Runs the signal rules to open and close long positions, accounting for 0.07% commission and 0.05% slippage on each side.</p>
+    </div>
+    <div class="step-card">
+        <h4>3. Summarise performance</h4>
+        <p>Builds the equity curve, calculates trade stats, and highlights risk/reward metrics so you can judge robustness.</p>
+    </div>
+</div>
+"""
+
+_TAKEAWAYS_TMPL = (
+    "- {total_trades} trades simulated across the selected window.\n"
+    "- Equity {direction} by {net_abs:.2f}% with a max drawdown of {max_drawdown:.2f}%.\n"
+    "- Strategy was in the market {exposure_pct:.1f}% of the time, "
+    "holding trades for about {avg_hold:.1f} hours on average.\n"
+    "- Win/loss ratio: {win_loss_display} with gross gains of "
+    "+{gross_gain:.2f}% versus losses of -{gross_loss:.2f}%."
+)
+
 tab_labels = ["Interactive Chart", "Recent Signals"]
 if backtest_mode:
     tab_labels.append("Backtest Insights")
 tabs = st.tabs(tab_labels)
 
-with tabs[0]:
+# Above this many candles the Plotly figure payload dominates rerun
+# latency (it is re-serialized over the websocket in full); the lighter
+# canvas-rendered Altair chart takes over for big windows.
+_ALTAIR_THRESHOLD = 10_000
+
+
+def _render_altair_fallback(df: pd.DataFrame) -> None:
+    plotting = _plotting()
+    try:
+        basic_chart = plotting.plot_btc_chart_altair(
+            df,
+            show_signals=show_signals,
+            show_bbands=show_bbands,
+            show_emas=show_emas,
+        )
+        st.altair_chart(basic_chart, use_container_width=True)
+    except Exception as exc:
+        st.error(f"Fallback chart failed to render ({exc}). Showing the raw close series instead.")
+        st.line_chart(df["close"])
+
+
+@st.fragment(run_every=refresh_rate)
+def _render_interactive_chart() -> None:
+    df = _live_df()
+    plotting = _plotting()
     badge_html = "".join(f"<span>{label}</span>" for label in active_overlay_labels) or "<span class='inactive'>No overlays active</span>"
     st.markdown(f"<div class='overlay-active-badge'>{badge_html}</div>", unsafe_allow_html=True)
     fallback_chart_used = False
-    if PLOTLY_AVAILABLE:
+    large_dataset = len(df) > _ALTAIR_THRESHOLD
+    if plotting.PLOTLY_AVAILABLE and not large_dataset:
         try:
-            fig = plot_btc_chart(
+            fig = plotting.plot_btc_chart(
                 df,
                 interval,
                 period,
@@ -1451,32 +1349,27 @@ with tabs[0]:
         except Exception as exc:
             fallback_chart_used = True
             st.error(f"Plotly chart failed to render ({exc}). Showing simplified chart instead.")
-            basic_chart = plot_btc_chart_altair(
-                df,
-                show_signals=show_signals,
-                show_bbands=show_bbands,
-                show_emas=show_emas,
-            )
-            st.altair_chart(basic_chart, use_container_width=True)
+            _render_altair_fallback(df)
     else:
         fallback_chart_used = True
-        basic_chart = plot_btc_chart_altair(
-            df,
-            show_signals=show_signals,
-            show_bbands=show_bbands,
-            show_emas=show_emas,
-        )
-        st.altair_chart(basic_chart, use_container_width=True)
+        _render_altair_fallback(df)
 
-    if fallback_chart_used:
+    if fallback_chart_used and large_dataset and plotting.PLOTLY_AVAILABLE:
+        st.caption(
+            f"Showing the lightweight chart for this {len(df):,}-candle window; "
+            "pick a shorter lookback or higher interval for the full multi-panel view."
+        )
+    elif fallback_chart_used:
         st.caption("Displaying simplified Altair chart. Install `plotly` for the full multi-panel experience.")
     else:
         st.caption("Tip: Combine trend (EMAs) and momentum (MACD/RSI) overlays to confirm breakout confidence.")
 
+
+with tabs[0]:
+    _render_interactive_chart()
+
 with tabs[1]:
-    table_cols = [
-        col for col in ["close", "rsi", "signal", "signal_strength", "divergence"] if col in df.columns
-    ]
+    table_cols = [col for col in _RECENT_TABLE_COLUMNS if col in df.columns]
     st.dataframe(df.tail(10)[table_cols].round(3), use_container_width=True)
     st.caption("Most recent 10 signals. Use the download button above to export the entire dataset.")
 
@@ -1506,95 +1399,96 @@ if backtest_mode:
             net_class = "positive" if net_return >= 0 else "negative"
             win_class = "positive" if win_rate >= 50 else "negative"
             dd_class = "negative" if max_drawdown > 0 else "positive"
-            summary_html = f"""
-            <div class="backtest-summary">
-                <h3>Backtest Overview</h3>
-                <p>Starting from <strong>${initial_balance:,.2f}</strong>, the strategy finished with <strong>${final_balance:,.2f}</strong> ({net_return:+.2f}%) over the last {lookback_days} days on the {selected_interval_label} chart. It captured {win_rate:.1f}% of {total_trades} simulated trades with a peak drawdown of {max_drawdown:.2f}%.</p>
-                <div class="chip-row" style="margin:0;gap:0.5rem;">
-                    <span class="summary-chip {net_class}">Net return {net_return:+.2f}%</span>
-                    <span class="summary-chip {win_class}">Win rate {win_rate:.1f}%</span>
-                    <span class="summary-chip {dd_class}">Max drawdown {max_drawdown:.2f}%</span>
-                </div>
-            </div>
-            """
-            st.markdown(summary_html, unsafe_allow_html=True)
-
-            steps_html = f"""
-            <div class="backtest-steps">
-                <div class="step-card">
-                    <h4>1. Gather price & indicators</h4>
-                    <p>Pulls {lookback_days} days of {selected_interval_label} candles and computes EMA, RSI, MACD, and Bollinger overlays.</p>
-                </div>
-                <div class="step-card">
-                    <h4>2. Simulate the strategy</h4>
-                    <p>Runs the signal rules to open and close long positions, accounting for 0.07% commission and 0.05% slippage on each side.</p>
-                </div>
-                <div class="step-card">
-                    <h4>3. Summarise performance</h4>
-                    <p>Builds the equity curve, calculates trade stats, and highlights risk/reward metrics so you can judge robustness.</p>
-                </div>
-            </div>
-            """
-            st.markdown(steps_html, unsafe_allow_html=True)
-
-            score_cols = st.columns(3)
-            with score_cols[0]:
-                render_metric_card("Total Trades", f"{total_trades}")
-            with score_cols[1]:
-                render_metric_card(
-                    "Net Return",
-                    f"{net_return:.2f}%",
-                    delta=net_return,
-                    delta_suffix="%",
-                )
-            with score_cols[2]:
-                render_metric_card("Final Balance", f"${final_balance:,.2f}")
-
-            risk_cols = st.columns(3)
-            with risk_cols[0]:
-                render_metric_card("Win Rate", f"{win_rate:.2f}%")
-            with risk_cols[1]:
-                render_metric_card(
-                    "Max Drawdown",
-                    f"{max_drawdown:.2f}%",
-                    delta=-max_drawdown,
-                    delta_suffix="%",
-                )
-            with risk_cols[2]:
-                profit_factor_display = "∞" if not math.isfinite(profit_factor) else f"{profit_factor:.2f}"
-                render_metric_card("Profit Factor", profit_factor_display)
-
-            texture_cols = st.columns(3)
-            with texture_cols[0]:
-                render_metric_card(
-                    "Best / Worst Trade",
-                    f"{best_trade:+.2f}% / {worst_trade:+.2f}%",
-                )
-            with texture_cols[1]:
-                render_metric_card(
-                    "Avg Hold Time",
-                    f"{avg_hold:.1f} hrs",
-                    badge=f"median {median_hold:.1f} hrs",
-                )
-            with texture_cols[2]:
-                render_metric_card("Exposure", f"{exposure_pct:.1f}% of time")
+            st.markdown(
+                _BACKTEST_SUMMARY_TMPL.format(
+                    initial_balance=initial_balance,
+                    final_balance=final_balance,
+                    net_return=net_return,
+                    lookback_days=lookback_days,
+                    interval_label=selected_interval_label,
+                    win_rate=win_rate,
+                    total_trades=total_trades,
+                    max_drawdown=max_drawdown,
+                    net_class=net_class,
+                    win_class=win_class,
+                    dd_class=dd_class,
+                ),
+                unsafe_allow_html=True,
+            )
+
+            st.markdown(
+                _BACKTEST_STEPS_TMPL.format(
+                    lookback_days=lookback_days,
+                    interval_label=selected_interval_label,
+                ),
+                unsafe_allow_html=True,
+            )
+
+            render_metric_row(
+                [
+                    dict(label="Total Trades", value=f"{total_trades}"),
+                    dict(
+                        label="Net Return",
+                        value=f"{net_return:.2f}%",
+                        delta=net_return,
+                        delta_suffix="%",
+                    ),
+                    dict(label="Final Balance", value=f"${final_balance:,.2f}"),
+                ]
+            )
+
+            profit_factor_display = "∞" if not math.isfinite(profit_factor) else f"{profit_factor:.2f}"
+            render_metric_row(
+                [
+                    dict(label="Win Rate", value=f"{win_rate:.2f}%"),
+                    dict(
+                        label="Max Drawdown",
+                        value=f"{max_drawdown:.2f}%",
+                        delta=-max_drawdown,
+                        delta_suffix="%",
+                    ),
+                    dict(label="Profit Factor", value=profit_factor_display),
+                ]
+            )
+
+            render_metric_row(
+                [
+                    dict(
+                        label="Best / Worst Trade",
+                        value=f"{best_trade:+.2f}% / {worst_trade:+.2f}%",
+                    ),
+                    dict(
+                        label="Avg Hold Time",
+                        value=f"{avg_hold:.1f} hrs",
+                        badge=f"median {median_hold:.1f} hrs",
+                    ),
+                    dict(label="Exposure", value=f"{exposure_pct:.1f}% of time"),
+                ]
+            )
 
             st.markdown("**Quick takeaways**")
             win_loss_display = "∞" if not isinstance(win_loss_ratio, float) or not math.isfinite(win_loss_ratio) else f"{win_loss_ratio:.2f}"
-            takeaways = [
-                f"- {total_trades} trades simulated across the selected window.",
-                f"- Equity {'grew' if net_return >= 0 else 'declined'} by {abs(net_return):.2f}% with a max drawdown of {max_drawdown:.2f}%.",
-                f"- Strategy was in the market {exposure_pct:.1f}% of the time, holding trades for about {avg_hold:.1f} hours on average.",
-                f"- Win/loss ratio: {win_loss_display} with gross gains of +{gross_gain:.2f}% versus losses of -{gross_loss:.2f}%.",
-            ]
-            st.markdown("\n".join(takeaways))
+            st.markdown(
+                _TAKEAWAYS_TMPL.format(
+                    total_trades=total_trades,
+                    direction="grew" if net_return >= 0 else "declined",
+                    net_abs=abs(net_return),
+                    max_drawdown=max_drawdown,
+                    exposure_pct=exposure_pct,
+                    avg_hold=avg_hold,
+                    win_loss_display=win_loss_display,
+                    gross_gain=gross_gain,
+                    gross_loss=gross_loss,
+                )
+            )
 
             if equity_curve is not None and not equity_curve.empty:
                 st.markdown("##### Equity Curve (net of fees)")
                 equity_fallback = False
-                if PLOTLY_AVAILABLE:
+                plotting = _plotting()
+                if plotting.PLOTLY_AVAILABLE:
                     try:
-                        equity_fig = plot_equity_curve(equity_curve, trades_df if trades_df is not None and not trades_df.empty else None)
+                        equity_fig = plotting.plot_equity_curve(equity_curve, trades_df if trades_df is not None and not trades_df.empty else None)
                         st.plotly_chart(
                             equity_fig,
                             use_container_width=True,
@@ -1603,11 +1497,11 @@ if backtest_mode:
                     except Exception as exc:
                         equity_fallback = True
                         st.error(f"Could not render Plotly equity curve ({exc}). Showing simplified view.")
-                        fallback_chart = plot_equity_curve_altair(equity_curve)
+                        fallback_chart = plotting.plot_equity_curve_altair(equity_curve)
                         st.altair_chart(fallback_chart, use_container_width=True)
                 else:
                     equity_fallback = True
-                    fallback_chart = plot_equity_curve_altair(equity_curve)
+                    fallback_chart = plotting.plot_equity_curve_altair(equity_curve)
                     st.altair_chart(fallback_chart, use_container_width=True)
 
                 if equity_fallback:
@@ -1617,9 +1511,11 @@ if backtest_mode:
 
             if trades_df is not None and not trades_df.empty:
                 st.markdown("##### Trade Log")
+                # round() already returns a fresh frame, so the explicit
+                # .copy() before renaming was a third materialization.
                 trades_show = trades_df[
                     ["entry_time", "exit_time", "entry_price", "exit_price", "pnl_pct", "duration_hrs"]
-                ].copy()
+                ].round(2)
                 trades_show.columns = [
                     "Entry",
                     "Exit",
@@ -1628,7 +1524,7 @@ if backtest_mode:
                     "PnL (%)",
                     "Hold (hrs)",
                 ]
-                st.dataframe(trades_show.round(2), width="stretch")
+                st.dataframe(trades_show, width="stretch")
             else:
                 st.info("Backtest completed, but no closed trades were recorded for this window.")
 
@@ -1651,3 +1547,5 @@ if backtest_mode:
                     - Results depend on the lookback window; rerun with different ranges to stress test robustness.
                     """
                 )
+
+_flush_toasts()